@@ -88,6 +88,8 @@ class BaseModule(metaclass=ModuleRegistryMeta):
         {"API_CONFIG": PosixPath("/vault/secrets/api-config.json")}
     """
 
+    __slots__ = ("client",)
+
     # Class attributes to identify the module type and its default secret paths
     MODULE_NAME: ClassVar[str] = "BASE"
     DEFAULT_SECRET_PATHS: ClassVar[dict[str, str]] = {}
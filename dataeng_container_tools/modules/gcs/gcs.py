@@ -5,10 +5,13 @@ Deals with receiving downloading and uploading files from/to GCP.
 
 from __future__ import annotations
 
+import importlib.util
 import io
 import json
 import os
+import posixpath
 from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, cast, overload
 
@@ -16,9 +19,11 @@ from dataeng_container_tools.modules import BaseModule, BaseModuleUtilities
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from types import ModuleType
 
     import pandas as pd
     import polars as pl
+    import pyarrow.dataset as ds
     from google.cloud import storage
     from google.cloud.storage.blob import Blob
 
@@ -27,6 +32,73 @@ PathToURI = tuple[str | os.PathLike[str], str]
 ObjectToURI = tuple[object, str]
 
 
+@cache
+def _storage() -> ModuleType:
+    """Lazily imports google.cloud.storage once and returns the module."""
+    from google.cloud import storage
+
+    return storage
+
+
+def _mount_connection_pool(client: storage.Client, max_workers: int) -> None:
+    """Sizes the client's HTTP connection pool for `max_workers` concurrent transfers."""
+    from requests.adapters import HTTPAdapter
+
+    # The default pool keeps 10 connections per host, fewer than the concurrent transfers
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    client._http.mount("https://", adapter)  # noqa: SLF001
+    client._http.mount("http://", adapter)  # noqa: SLF001
+
+
+@cache
+def _local_client(max_workers: int) -> storage.Client:
+    """Creates the anonymous emulator client once per pool size, it holds no per-instance credentials."""
+    from google.auth.credentials import AnonymousCredentials
+
+    client = _storage().Client(credentials=AnonymousCredentials())
+    _mount_connection_pool(client, max_workers)
+    return client
+
+
+def _env_metadata() -> dict[str, str]:
+    """Reads the upload metadata environment variables, which the command line arguments may set at runtime."""
+    env_vars = ["DAG_ID", "RUN_ID", "NAMESPACE", "POD_NAME", "GITHUB_SHA"]
+    return {var: os.environ[var] for var in env_vars if var in os.environ}
+
+
+@cache
+def _excel_read_engine() -> str:
+    """Picks the pandas xlsx reader once, the Rust-based calamine when installed, otherwise openpyxl."""
+    return "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
+
+@cache
+def _pandas() -> ModuleType:
+    """Lazily imports pandas once and returns the module."""
+    import pandas as pd
+
+    return pd
+
+
+@cache
+def _polars() -> ModuleType:
+    """Lazily imports polars once and returns the module.
+
+    Raises:
+        ImportError: If polars is not installed.
+    """
+    try:
+        import polars as pl
+    except ImportError as err:
+        msg = (
+            "Polars is not installed. Please install it with 'pip install polars' "
+            "or 'pip install dataeng-container-tools[polars]'"
+        )
+        raise ImportError(msg) from err
+
+    return pl
+
+
 class GCSUriUtils:
     """Utility class for handling GCS URIs.
 
@@ -47,8 +119,6 @@ class GCSUriUtils:
         Returns:
             The normalized GCS URI string.
         """
-        import posixpath
-
         gcs_uri = gcs_uri.removeprefix(GCSUriUtils.PREFIX)
         return GCSUriUtils.PREFIX + posixpath.normpath(gcs_uri)
 
@@ -69,13 +139,8 @@ class GCSUriUtils:
             msg = f"Invalid GCS URI: '{gcs_uri}'. URI must start with '{GCSUriUtils.PREFIX}'"
             raise ValueError(msg)
 
-        gcs_uri = gcs_uri.removeprefix(GCSUriUtils.PREFIX)
-
-        if "/" not in gcs_uri:  # Assume the URI is the bucket name
-            return gcs_uri, ""
-
-        bucket = gcs_uri[: gcs_uri.find("/")]
-        file_path = gcs_uri[gcs_uri.find("/") + 1 :]
+        # Without a "/" the URI is assumed to be the bucket name and the file path is empty
+        bucket, _, file_path = gcs_uri.removeprefix(GCSUriUtils.PREFIX).partition("/")
         return bucket, file_path
 
     @staticmethod
@@ -179,11 +244,19 @@ class GCSFileIO(BaseModule):
             >>> gcs_io.upload(src_dst=[(df_to_upload, "gs://my-bucket/uploaded_dataframe.csv")])
     """
 
+    __slots__ = ("engine", "local", "max_workers")
+
     MODULE_NAME: ClassVar[str] = "GCS"
     DEFAULT_SECRET_PATHS: ClassVar[dict[str, str]] = {"GCS": "/vault/secrets/gcp-sa-storage.json"}
 
     KNOWN_EXTENSIONS: Final = {".parquet", ".csv", ".xlsx", ".json"}
 
+    DEFAULT_MAX_WORKERS: Final = 16
+    WILDCARD_CHARACTERS: Final = frozenset("*?[]{}")
+
+    LARGE_DOWNLOAD_THRESHOLD: Final = 32 * 1024 * 1024  # 32 MiB
+    LARGE_DOWNLOAD_CHUNK_SIZE: Final = 8 * 1024 * 1024  # 8 MiB
+
     def __init__(
         self,
         gcs_secret_location: str | os.PathLike[str] | None = None,
@@ -192,6 +265,7 @@ class GCSFileIO(BaseModule):
         use_cla_fallback: bool = True,
         engine: Literal["pandas", "polars"] = "pandas",
         use_file_fallback: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         """Initializes GCSFileIO with desired configuration.
 
@@ -205,27 +279,20 @@ class GCSFileIO(BaseModule):
                 as a fallback if other sources fail.
             engine: The data engine to use. Defaults to "pandas".
                 Can also be "polars".
+            max_workers: Maximum number of threads used to transfer multiple files concurrently.
 
         Raises:
             ImportError: If "polars" is selected as the engine but is not installed.
             FileNotFoundError: If GCS credentials are not found and not in local mode.
         """
-        from google.cloud import storage
-
         self.engine = engine
+        self.max_workers = max_workers
 
         # Check imports + preload
         if self.engine == "polars":
-            try:
-                import polars as pl  # noqa: F401
-            except ImportError as err:
-                msg = (
-                    "Polars is not installed. Please install it with 'pip install polars' "
-                    "or 'pip install dataeng-container-tools[polars]'"
-                )
-                raise ImportError(msg) from err
+            _polars()
         else:
-            import pandas as pd  # noqa: F401
+            _pandas()
 
         # Credentials
         self.local = local
@@ -240,11 +307,11 @@ class GCSFileIO(BaseModule):
                 msg = "GCS credentials not found"
                 raise FileNotFoundError(msg)
 
-            self.client: storage.Client = storage.Client.from_service_account_info(gcs_sa)
+            self.client: storage.Client = _storage().Client.from_service_account_info(gcs_sa)
+            _mount_connection_pool(self.client, self.max_workers)
         else:
-            from google.auth.credentials import AnonymousCredentials
-
-            self.client: storage.Client = storage.Client(credentials=AnonymousCredentials())
+            # Every local instance talks to the same emulator, so they share one client
+            self.client: storage.Client = _local_client(self.max_workers)
 
     def uri_to_blobs(self, gcs_uri: str) -> Iterator[Blob]:
         """Converts a GCS URI to an iterator of Blob objects.
@@ -262,7 +329,13 @@ class GCSFileIO(BaseModule):
         """
         bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
         bucket = self.client.bucket(bucket_name)
-        return bucket.list_blobs(match_glob=file_path)
+
+        # Bound the listing to the glob's literal prefix, stopping at a backslash as it escapes the next character
+        prefix_end = next(
+            (i for i, char in enumerate(file_path) if char in self.WILDCARD_CHARACTERS or char == "\\"),
+            len(file_path),
+        )
+        return bucket.list_blobs(prefix=file_path[:prefix_end], match_glob=file_path)
 
     @overload
     def download(  # URI to file
@@ -303,6 +376,9 @@ class GCSFileIO(BaseModule):
             - If the file extension is not recognized, it returns an `io.BytesIO` object.
             - For CSV files, keyword arguments like `header`, `delimiter`, `encoding` can be passed via `**kwargs`.
             - For XLSX files, keyword arguments like `header` can be passed via `**kwargs`.
+            - For CSV files with the pandas engine, `use_arrow=True` uses the multi-threaded pyarrow parser.
+            - For Parquet files, `columns` can be passed via `**kwargs` to only read the listed columns.
+            - For JSON files, pass `as_dataframe=False` to get the parsed `dict`/`list` instead of a DataFrame.
 
         Args:
             src_dst:
@@ -355,21 +431,17 @@ class GCSFileIO(BaseModule):
                 >>> parquet_df = object_dict["my-bucket/ataset.parquet"]
                 >>> metadata_obj = object_dict["my-bucket/metadata.json"] # Likely an io.BytesIO object
         """
-        # Convert to lists for simplification
+        # Wrap single items; any other iterable (including generators) is consumed directly below
         if isinstance(src_dst, (str, bytes, tuple)):
-            src_dsts = [src_dst]
-        elif isinstance(src_dst, list):
-            src_dsts = src_dst
-        elif isinstance(src_dst, Iterable):
-            src_dsts = list(src_dst)
-        else:
+            src_dst = [src_dst]
+        elif not isinstance(src_dst, Iterable):
             msg = f"Unsupported src_dst type: {type(src_dst)}. Expected an Iterable (list)."
             raise TypeError(msg)
 
-        # Sort the items
+        # Sort the items in a single pass
         file_downloads = []
         object_downloads = []
-        for item in src_dsts:
+        for item in src_dst:
             if isinstance(item, tuple):
                 # File download: (GCS URI, local path)
                 file_downloads.append(item)
@@ -410,9 +482,14 @@ class GCSFileIO(BaseModule):
             ValueError: If a GCS URI contains wildcards, which are not supported for direct file downloads.
                 Use `_download_to_object()` for glob pattern matching.
         """
-        for gcs_uri, local_file_path in src_dst:
+        from concurrent.futures import ThreadPoolExecutor
+
+        src_dst = list(src_dst)
+
+        # Validate every URI before starting any transfer
+        for gcs_uri, _ in src_dst:
             # Check for wildcards which are not supported for direct file downloads
-            if any(wildcard in gcs_uri for wildcard in ["*", "?", "[", "]", "{", "}"]):
+            if not self.WILDCARD_CHARACTERS.isdisjoint(gcs_uri):
                 msg = (
                     f"Wildcards are not supported for direct file downloads. "
                     f"URI '{gcs_uri}' contains wildcards. "
@@ -420,15 +497,42 @@ class GCSFileIO(BaseModule):
                 )
                 raise ValueError(msg)
 
-            bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
-            bucket = self.client.bucket(bucket_name)
-            blob = bucket.blob(file_path)
-            if blob.exists():
-                blob.download_to_filename(str(local_file_path))
-            else:
-                msg = f"Blob {file_path} does not exist in bucket {bucket_name}"
-                # In the future also raise 'google.cloud.exceptions.NotFound' in an ExceptionGroup (Python 3.11)
-                raise FileNotFoundError(msg)
+        if len(src_dst) <= 1 or self.max_workers <= 1:
+            for gcs_uri, local_file_path in src_dst:
+                self._download_one(gcs_uri, local_file_path, self.max_workers)
+            return
+
+        workers = min(self.max_workers, len(src_dst))
+        range_workers = self._range_workers(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consuming the results re-raises the first failure in input order
+            list(executor.map(lambda item: self._download_one(*item, range_workers), src_dst))
+
+    def _download_one(self, gcs_uri: str, local_file_path: str | os.PathLike[str], range_workers: int) -> None:
+        """Helper to download a single GCS blob to a local file path with up to `range_workers` ranged requests."""
+        from google.api_core.exceptions import NotFound
+        from google.cloud.storage import transfer_manager
+
+        bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
+        bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(file_path)
+        try:
+            blob.reload()  # Same round-trip as exists(), but also fetches the size
+        except NotFound as err:
+            msg = f"Blob {file_path} does not exist in bucket {bucket_name}"
+            # In the future also raise 'google.cloud.exceptions.NotFound' in an ExceptionGroup (Python 3.11)
+            raise FileNotFoundError(msg) from err
+
+        if (blob.size or 0) > self.LARGE_DOWNLOAD_THRESHOLD and range_workers > 1:
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                str(local_file_path),
+                chunk_size=self.LARGE_DOWNLOAD_CHUNK_SIZE,
+                worker_type=transfer_manager.THREAD,
+                max_workers=range_workers,
+            )
+        else:
+            blob.download_to_filename(str(local_file_path))
 
     def _download_to_object(
         self,
@@ -441,8 +545,13 @@ class GCSFileIO(BaseModule):
         Supports various file types like Parquet, CSV, XLSX, and JSON.
         If the file extension is not recognized, it returns an `io.BytesIO` object.
 
+        For Parquet files, `columns` can be passed via `**kwargs` to only read the listed columns.
         For CSV files, keyword arguments like `header`, `delimiter`, `encoding` can be passed via `**kwargs`.
+        With the pandas engine, `use_arrow=True` parses CSV files with the multi-threaded pyarrow parser.
         For XLSX files, keyword arguments like `header` can be passed via `**kwargs`.
+        For JSON files, `as_dataframe=False` skips DataFrame construction and returns the
+        parsed `dict`/`list`.
+        With the pandas engine, JSON that is not tabular is also returned as the parsed object.
 
         Args:
             gcs_uris: A list of GCS URIs to download.
@@ -466,27 +575,91 @@ class GCSFileIO(BaseModule):
         if not isinstance(gcs_uris, list):
             gcs_uris = [gcs_uris]
 
-        data_dict = {}
-        for blob in (blob for uri in gcs_uris for blob in self.uri_to_blobs(uri)):
-            if not blob.exists():  # Likely won't happen due to uri_to_blobs handling
-                msg = f"Blob {blob.name} does not exist in bucket {blob.bucket.name}"
-                # In the future also raise 'google.cloud.exceptions.NotFound' in an ExceptionGroup (Python 3.11)
-                raise FileNotFoundError(msg)
+        # Repeated URIs (e.g. from concatenated batches) would list and download the same blobs again
+        unique_uris = {GCSUriUtils.get_components(uri): uri for uri in gcs_uris}.values()
+
+        if self.max_workers <= 1:
+            blobs: dict[str, Blob] = {}
+            for uri in unique_uris:
+                for blob in self.uri_to_blobs(uri):
+                    # Overlapping globs can match the same blob more than once
+                    blobs.setdefault(f"{blob.bucket.name}/{blob.name}", blob)
+            return {blob_key: self._fetch_and_parse(blob, dtype, **kwargs) for blob_key, blob in blobs.items()}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # List every URI concurrently
+            listings = [executor.submit(lambda uri: list(self.uri_to_blobs(uri)), uri) for uri in unique_uris]
+
+            blobs = {}
+            for listing in listings:
+                for blob in listing.result():
+                    # Overlapping globs can match the same blob more than once
+                    blobs.setdefault(f"{blob.bucket.name}/{blob.name}", blob)
+
+            # Split the pool between blobs so ranged downloads of large ones do not multiply the connections
+            range_workers = self._range_workers(min(self.max_workers, len(blobs)))
+            downloads = {
+                blob_key: executor.submit(self._fetch_and_parse, blob, dtype, range_workers=range_workers, **kwargs)
+                for blob_key, blob in blobs.items()
+            }
+            return {blob_key: download.result() for blob_key, download in downloads.items()}
+
+    def _fetch_and_parse(
+        self,
+        blob: Blob,
+        dtype: dict | None = None,
+        *,
+        range_workers: int | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame | pl.DataFrame | io.BytesIO:
+        """Helper to download a single blob and parse it based on its file extension."""
+        from google.api_core.exceptions import NotFound
+
+        try:
+            data = io.BytesIO(self._download_as_bytes(blob, range_workers))
+        except NotFound as err:  # Deleted between listing and download
+            msg = f"Blob {blob.name} does not exist in bucket {blob.bucket.name}"
+            raise FileNotFoundError(msg) from err
+
+        file_name = cast("str", blob.name)
+        file_extension = next(
+            (ext.lstrip(".") for ext in self.KNOWN_EXTENSIONS if file_name.endswith(ext)),
+            None,
+        )
 
-            data = io.BytesIO(blob.download_as_bytes())
+        # If no recognized format, return the file object itself or processed df
+        return self._read_file_object(data, file_extension, dtype, **kwargs)
 
-            file_name = cast("str", blob.name)
-            file_extension = next((ext.lstrip(".") for ext in self.KNOWN_EXTENSIONS if file_name.endswith(ext)), None)
+    def _range_workers(self, concurrent_blobs: int) -> int:
+        """Helper to split `max_workers` between blobs transferred at once, keeping the total within the pool."""
+        return max(1, self.max_workers // max(1, concurrent_blobs))
 
-            # If no recognized format, return the file object itself or processed df
-            data_dict[f"{blob.bucket.name}/{blob.name}"] = self._read_file_object(
-                data,
-                file_extension,
-                dtype,
-                **kwargs,
-            )
+    def _download_as_bytes(self, blob: Blob, range_workers: int | None = None) -> bytes:
+        """Helper to download a blob into memory, using up to `range_workers` ranged requests for large blobs.
 
-        return data_dict
+        `range_workers` defaults to `max_workers`, callers downloading several blobs at once pass their share.
+        """
+        if range_workers is None:
+            range_workers = self.max_workers
+
+        size = blob.size or 0
+        if size <= self.LARGE_DOWNLOAD_THRESHOLD or range_workers <= 1:
+            return blob.download_as_bytes()
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunk_size = self.LARGE_DOWNLOAD_CHUNK_SIZE
+        ranges = [(start, min(start + chunk_size, size) - 1) for start in range(0, size, chunk_size)]
+
+        def download_range(byte_range: tuple[int, int]) -> bytes:
+            # Pin the generation so an overwrite mid-download cannot mix object versions
+            start, end = byte_range
+            return blob.download_as_bytes(start=start, end=end, if_generation_match=blob.generation)
+
+        with ThreadPoolExecutor(max_workers=min(range_workers, len(ranges))) as executor:
+            return b"".join(executor.map(download_range, ranges))
 
     def _read_file_object(
         self,
@@ -497,9 +670,13 @@ class GCSFileIO(BaseModule):
     ) -> pd.DataFrame | pl.DataFrame | io.BytesIO:
         """Helper to read file object into DataFrame or return bytes."""
         if self.engine == "polars":
-            import polars as pl
+            pl = _polars()
         else:
-            import pandas as pd
+            pd = _pandas()
+
+        # Consumed here so they are never forwarded to the underlying readers
+        as_dataframe = kwargs.pop("as_dataframe", True)
+        use_arrow = kwargs.pop("use_arrow", False)
 
         if file_extension == "parquet":
             if self.engine == "polars":
@@ -508,9 +685,18 @@ class GCSFileIO(BaseModule):
                     file_obj = file_obj.cast(dtype)
                 return file_obj
 
-            file_obj = pd.read_parquet(data, **kwargs)
+            parquet_kwargs = kwargs.copy()
+            parquet_kwargs.setdefault("engine", "pyarrow")
+            if parquet_kwargs["engine"] == "pyarrow":
+                import pyarrow as pa
+
+                # Zero-copy view over the downloaded bytes, read natively instead of through Python file calls
+                file_obj = pd.read_parquet(pa.BufferReader(data.getbuffer()), **parquet_kwargs)
+            else:
+                file_obj = pd.read_parquet(data, **parquet_kwargs)
             if dtype:
-                file_obj = file_obj.astype(dtype)
+                # Columns already of the requested dtype are not copied
+                file_obj = file_obj.astype(dtype, copy=False)
             return file_obj
 
         if file_extension == "csv":
@@ -520,6 +706,9 @@ class GCSFileIO(BaseModule):
                 return pl.read_csv(data, schema_overrides=dtype, **csv_kwargs)
 
             csv_kwargs.setdefault("encoding", "utf-8")
+            if use_arrow:
+                # Multi-threaded Arrow parser; supports a subset of the pandas C parser options
+                csv_kwargs.setdefault("engine", "pyarrow")
             if dtype:
                 return pd.read_csv(data, dtype=dtype, **csv_kwargs)
             return pd.read_csv(data, **csv_kwargs)
@@ -529,19 +718,174 @@ class GCSFileIO(BaseModule):
             if self.engine == "polars":
                 return pl.read_excel(data, schema_overrides=dtype, **xlsx_kwargs)
 
-            xlsx_kwargs.setdefault("engine", "openpyxl")
+            xlsx_kwargs.setdefault("engine", _excel_read_engine())
             if dtype:
                 return pd.read_excel(data, dtype=dtype, **xlsx_kwargs)
             return pd.read_excel(data, **xlsx_kwargs)
 
         if file_extension == "json":
+            if not as_dataframe:
+                return self._load_json(data)
+
             json_kwargs = kwargs.copy()
             if self.engine == "polars":
                 return pl.read_json(data, **json_kwargs)
-            return pd.read_json(data, **json_kwargs)
+            if json_kwargs:  # Explicit orient/lines/etc. means the caller expects a DataFrame
+                return pd.read_json(data, **json_kwargs)
+
+            try:
+                return pd.read_json(data)
+            except ValueError:
+                # Not tabular (e.g. a dict of scalars), return the decoded object rather than failing
+                return self._load_json(data)
 
         return data
 
+    @staticmethod
+    def _dump_json(obj: dict | list) -> bytes:
+        """Helper to encode JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+    @staticmethod
+    def _load_json(data: io.BytesIO) -> Any:  # noqa: ANN401
+        """Helper to decode JSON bytes."""
+        return json.loads(data.getvalue())
+
+    def download_iter(
+        self,
+        gcs_uris: str | Iterable[str],
+        dtype: dict | None = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[str, pd.DataFrame | pl.DataFrame | io.BytesIO]]:
+        """Downloads file(s) from GCS and yields each parsed object while later ones are prefetched.
+
+        Unlike `download`, which returns once every blob is parsed, up to `max_workers`
+        blobs are downloaded ahead of the caller. Processing one object therefore overlaps
+        with downloading the next ones, and only that window is held in memory at a time.
+
+        Args:
+            gcs_uris: A GCS URI or list of GCS URIs to download.
+                Can include glob patterns for matching multiple files.
+            dtype: Dictionary specifying data types for columns, as in `download`.
+            **kwargs: Additional keyword arguments passed to the underlying file reading
+                functions (e.g., `pandas.read_parquet`, `polars.read_parquet`).
+
+        Yields:
+            Tuples of the blob name (`bucket/path`) and its downloaded object, in listing order.
+
+        Examples:
+            Process daily files as they arrive:
+                >>> for name, df in gcs_io.download_iter("gs://my-bucket/daily/*.parquet"):
+                ...     process(df)
+        """
+        if isinstance(gcs_uris, str):
+            gcs_uris = [gcs_uris]
+
+        # Listing only fetches metadata, so it is done up front to size the prefetch window
+        blobs: dict[str, Blob] = {}
+        for uri in gcs_uris:
+            for blob in self.uri_to_blobs(uri):
+                # Overlapping globs can match the same blob more than once
+                blobs.setdefault(f"{blob.bucket.name}/{blob.name}", blob)
+
+        if len(blobs) <= 1 or self.max_workers <= 1:
+            for blob_key, blob in blobs.items():
+                yield blob_key, self._fetch_and_parse(blob, dtype, **kwargs)
+            return
+
+        from collections import deque
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        window = min(self.max_workers, len(blobs))
+        range_workers = self._range_workers(window)
+        pending: deque[tuple[str, Future[pd.DataFrame | pl.DataFrame | io.BytesIO]]] = deque()
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            try:
+                for blob_key, blob in blobs.items():
+                    download = executor.submit(
+                        self._fetch_and_parse,
+                        blob,
+                        dtype,
+                        range_workers=range_workers,
+                        **kwargs,
+                    )
+                    pending.append((blob_key, download))
+                    if len(pending) >= window:  # Window is full, hand the oldest to the caller
+                        oldest_key, download = pending.popleft()
+                        yield oldest_key, download.result()
+                while pending:
+                    oldest_key, download = pending.popleft()
+                    yield oldest_key, download.result()
+            finally:
+                for _, download in pending:  # Caller stopped early, drop downloads that have not started
+                    download.cancel()
+
+    def download_dataset(
+        self,
+        gcs_uris: str | Iterable[str],
+        *,
+        columns: list[str] | None = None,
+        filters: Any = None,  # noqa: ANN401
+    ) -> ds.Dataset:
+        """Downloads Parquet file(s) from GCS into a single PyArrow dataset.
+
+        Unlike `download`, which parses every blob into its own DataFrame, all matched
+        Parquet blobs are combined under one unified schema. Column projection and row
+        filters are applied while each file is decoded so unused data is never materialized.
+
+        Args:
+            gcs_uris: A GCS URI or list of GCS URIs to download.
+                Can include glob patterns. Blobs without a `.parquet` extension are skipped.
+            columns: If provided, only these columns are read.
+            filters: Row filters passed to `pyarrow.parquet.read_table`, either as a
+                `pyarrow.compute.Expression` or in the list-of-tuples (DNF) form.
+
+        Returns:
+            A `pyarrow.dataset.Dataset` containing the rows of every matched Parquet blob.
+            Use `.to_table().to_pandas()` for Pandas or `polars.from_arrow(...)` for Polars.
+
+        Raises:
+            FileNotFoundError: If no Parquet blobs match `gcs_uris`.
+
+        Examples:
+            Read two columns across many Parquet files:
+                >>> dataset = gcs_io.download_dataset("gs://my-bucket/sales/*.parquet", columns=["region", "amount"])
+                >>> df = dataset.to_table().to_pandas()
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        gcs_uris = [gcs_uris] if isinstance(gcs_uris, str) else list(gcs_uris)
+
+        blobs: dict[str, Blob] = {}
+        for uri in gcs_uris:
+            for blob in self.uri_to_blobs(uri):
+                if cast("str", blob.name).endswith(".parquet"):
+                    # Overlapping globs can match the same blob more than once
+                    blobs.setdefault(f"{blob.bucket.name}/{blob.name}", blob)
+        if not blobs:
+            msg = f"No Parquet blobs found matching {gcs_uris}"
+            raise FileNotFoundError(msg)
+
+        workers = min(self.max_workers, len(blobs))
+        range_workers = self._range_workers(workers)
+
+        def read_table(blob: Blob) -> pa.Table:
+            data = self._download_as_bytes(blob, range_workers)
+            return pq.read_table(pa.BufferReader(data), columns=columns, filters=filters)
+
+        if workers <= 1:
+            tables = [read_table(blob) for blob in blobs.values()]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Downloads are I/O bound and pyarrow releases the GIL while decoding, so both overlap across blobs
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                tables = list(executor.map(read_table, blobs.values()))
+
+        return ds.dataset(pa.concat_tables(tables, promote_options="default"))
+
     @overload
     def upload(  # File to URI
         self,
@@ -584,15 +928,17 @@ class GCSFileIO(BaseModule):
                   Example: `("local_data.csv", "gs://bucket/remote_data.csv")`
                 - Object Uploads: An ObjectToURI which is a tuple (source object, destination uri).
                   Supported object types depend on the file extension of the `gcs_uri`
-                  (e.g., `pd.DataFrame` or `pl.DataFrame` for .parquet, .csv, .xlsx; `str` for .json,
-                  which will be `json.dumps`ed).
+                  (e.g., `pd.DataFrame` or `pl.DataFrame` for .parquet, .csv, .xlsx; `dict` or `list`
+                  for .json, which are serialized to JSON, or a `str` that is already JSON and is uploaded as-is).
                   Example: `(my_dataframe, "gs://bucket/df.parquet")`
             metadata: A dictionary of metadata to associate with the
                 uploaded GCS object(s). Environment variables (`DAG_ID`, `RUN_ID`,
                 `NAMESPACE`, `POD_NAME`, `GITHUB_SHA`) are automatically included if present.
             **kwargs: Additional keyword arguments passed to the underlying
                 upload or serialization functions (e.g., `pandas.DataFrame.to_parquet`,
-                `polars.DataFrame.write_parquet`).
+                `polars.DataFrame.write_parquet`). For CSV files with the pandas engine,
+                `use_arrow=True` encodes with the multi-threaded pyarrow writer, in which
+                case other keyword arguments go to `pyarrow.csv.WriteOptions`.
 
         Raises:
             ValueError: If uploading an object and no compatible file extension is found
@@ -615,25 +961,21 @@ class GCSFileIO(BaseModule):
                 >>> df = pd.DataFrame({'colA': [1, 2], 'colB': ['x', 'y']})
                 >>> gcs_io.upload(src_dst=(df, "gs://my-bucket/dataframes/my_df.parquet"))
 
-            Upload a string as a JSON file (will be json.dumps'd):
+            Upload an already serialized JSON string as a JSON file (uploaded as-is):
                 >>> my_config_str = '{"key": "value", "settings": [1, 2, 3]}'
                 >>> gcs_io.upload((my_config_str, "gs://my-bucket/configs/app_config.json"))
         """
-        # Convert to lists for simplification
+        # Wrap single items; any other iterable (including generators) is consumed directly below
         if isinstance(src_dst, (str, bytes, tuple)):
-            src_dsts = [src_dst]
-        elif isinstance(src_dst, list):
-            src_dsts = src_dst
-        elif isinstance(src_dst, Iterable):
-            src_dsts = list(src_dst)
-        else:
+            src_dst = [src_dst]
+        elif not isinstance(src_dst, Iterable):
             msg = f"Unsupported src_dst type: {type(src_dst)}. Expected an Iterable (list)."
             raise TypeError(msg)
 
-        # Sort the items
+        # Sort the items in a single pass
         file_uploads = []
         object_uploads = []
-        for source, gcs_uri in src_dsts:
+        for source, gcs_uri in src_dst:
             if isinstance(source, (str, Path)):
                 file_uploads.append((source, gcs_uri))
             else:
@@ -665,20 +1007,30 @@ class GCSFileIO(BaseModule):
                 GCS object(s). Environment variables (`DAG_ID`, `RUN_ID`, `NAMESPACE`,
                 `POD_NAME`, `GITHUB_SHA`) are automatically included if present.
         """
-        metadata = metadata or {}
+        # Add environment variables to metadata, explicitly provided values take precedence
+        metadata = {**_env_metadata(), **(metadata or {})}
+
+        src_dst = list(src_dst)
+
+        if len(src_dst) <= 1 or self.max_workers <= 1:
+            for file, gcs_uri in src_dst:
+                self._upload_one(file, gcs_uri, metadata)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Add environment variables to metadata
-        env_vars = ["DAG_ID", "RUN_ID", "NAMESPACE", "POD_NAME", "GITHUB_SHA"]
-        for var in env_vars:
-            if var in os.environ:
-                metadata.setdefault(var, os.environ[var])
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(src_dst))) as executor:
+            # Consuming the results re-raises the first failure in input order
+            list(executor.map(lambda item: self._upload_one(*item, metadata), src_dst))
+
+    def _upload_one(self, file: str | os.PathLike[str], gcs_uri: str, metadata: dict) -> None:
+        """Helper to upload a single local file to a GCS URI."""
+        bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
+        bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(file_path)
+        blob.metadata = metadata
 
-        for file, gcs_uri in src_dst:
-            bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
-            bucket = self.client.bucket(bucket_name)
-            blob = bucket.blob(file_path)
-            blob.metadata = metadata
-            blob.upload_from_filename(str(file))
+        blob.upload_from_filename(str(file))
 
     def _upload_object(
         self,
@@ -698,7 +1050,8 @@ class GCSFileIO(BaseModule):
             src_dst: List of tuples, where each tuple
                 contains (Python object, GCS URI) pairs to upload. Supported object types include:
                 - `pandas.DataFrame` or `pl.DataFrame` (for .parquet, .csv, .xlsx extensions in GCS URI)
-                - `str` (for .json extension in GCS URI; the string will be `json.dumps`'d)
+                - `dict` or `list` (for .json extension in GCS URI; serialized to JSON)
+                - `str` (for .json extension in GCS URI; uploaded as-is, so it must already be JSON)
             metadata: A dictionary of metadata to associate with the
                 GCS object(s). Environment variables (`DAG_ID`, `RUN_ID`, `NAMESPACE`,
                 `POD_NAME`, `GITHUB_SHA`) are automatically included if present.
@@ -709,25 +1062,58 @@ class GCSFileIO(BaseModule):
             ValueError: If no compatible file extension is found in the `gcs_uri`
                 for serializing the object, or if the object type is not supported for that extension.
         """
-        metadata = metadata or {}
+        # Add environment variables to metadata, explicitly provided values take precedence
+        metadata = {**_env_metadata(), **(metadata or {})}
+
+        src_dst = list(src_dst)
 
-        # Add environment variables to metadata
-        env_vars = ["DAG_ID", "RUN_ID", "NAMESPACE", "POD_NAME", "GITHUB_SHA"]
+        if len(src_dst) <= 1 or self.max_workers <= 1:
+            for object_to_upload, gcs_uri in src_dst:
+                self._upload_object_one(object_to_upload, gcs_uri, metadata, **kwargs)
+            return
 
-        for var in env_vars:
-            if var in os.environ:
-                metadata.setdefault(var, os.environ[var])
+        from concurrent.futures import ThreadPoolExecutor
 
-        for object_to_upload, gcs_uri in src_dst:
-            bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
-            bucket = self.client.bucket(bucket_name)
-            blob = bucket.blob(file_path)
-            blob.metadata = metadata
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(src_dst))) as executor:
+            # Consuming the results re-raises the first failure in input order
+            list(executor.map(lambda item: self._upload_object_one(*item, metadata, **kwargs), src_dst))
 
-            # Determine file type
-            file_extension = next((ext.lstrip(".") for ext in self.KNOWN_EXTENSIONS if file_path.endswith(ext)), None)
+    def _upload_object_one(self, object_to_upload: object, gcs_uri: str, metadata: dict, **kwargs: Any) -> None:
+        """Helper to serialize and upload a single Python object to a GCS URI."""
+        bucket_name, file_path = GCSUriUtils.get_components(gcs_uri)
+        bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(file_path)
+        blob.metadata = metadata
 
-            self._serialize_and_upload(object_to_upload, file_extension, blob, **kwargs)
+        # Determine file type
+        file_extension = next((ext.lstrip(".") for ext in self.KNOWN_EXTENSIONS if file_path.endswith(ext)), None)
+
+        self._serialize_and_upload(object_to_upload, file_extension, blob, **kwargs)
+
+    def _upload_buffer(self, blob: Blob, file_obj: io.BytesIO, content_type: str | None = None) -> None:
+        """Helper to upload a serialized in-memory buffer from the start."""
+        size = file_obj.getbuffer().nbytes
+        file_obj.seek(0)
+        blob.upload_from_file(file_obj, size=size, content_type=content_type)
+
+    @staticmethod
+    def _arrow_csv(df: pd.DataFrame, *, index: bool = False, **kwargs: Any) -> io.BytesIO:
+        """Helper to encode a pandas DataFrame as CSV with the pyarrow writer.
+
+        Args:
+            df: The DataFrame to encode.
+            index: Whether to write the index as columns, like `DataFrame.to_csv`.
+            **kwargs: Passed to `pyarrow.csv.WriteOptions` (e.g. `delimiter`, `include_header`).
+
+        Returns:
+            The UTF-8 encoded CSV buffer.
+        """
+        import pyarrow as pa
+        from pyarrow import csv
+
+        file_obj = io.BytesIO()
+        csv.write_csv(pa.Table.from_pandas(df, preserve_index=index), file_obj, csv.WriteOptions(**kwargs))
+        return file_obj
 
     def _serialize_and_upload(
         self,
@@ -738,24 +1124,26 @@ class GCSFileIO(BaseModule):
     ) -> None:
         """Helper to serialize and upload object."""
         if self.engine == "polars":
-            import polars as pl
+            pl = _polars()
         else:
-            import pandas as pd
+            pd = _pandas()
 
         if file_extension == "parquet":
             if self.engine == "polars" and isinstance(object_to_upload, pl.DataFrame):
                 parquet_kwargs = kwargs.copy()
                 file_obj = io.BytesIO()
                 object_to_upload.write_parquet(file_obj, **parquet_kwargs)
-                file_obj.seek(0)
-                blob.upload_from_file(file_obj)
+                self._upload_buffer(blob, file_obj)
                 return
             if self.engine == "pandas" and isinstance(object_to_upload, pd.DataFrame):
                 parquet_kwargs = kwargs.copy()
+                parquet_kwargs.setdefault("engine", "pyarrow")
+                if parquet_kwargs["engine"] == "pyarrow" and "compression" not in parquet_kwargs:
+                    # Smaller than snappy at comparable write speed
+                    parquet_kwargs.update(compression="zstd", compression_level=3)
                 file_obj = io.BytesIO()
                 object_to_upload.to_parquet(file_obj, **parquet_kwargs)
-                file_obj.seek(0)
-                blob.upload_from_file(file_obj)
+                self._upload_buffer(blob, file_obj)
                 return
 
         elif file_extension == "csv":
@@ -763,15 +1151,20 @@ class GCSFileIO(BaseModule):
                 csv_kwargs = kwargs.copy()
                 file_obj = io.BytesIO()
                 object_to_upload.write_csv(file_obj, **csv_kwargs)
-                file_obj.seek(0)
-                blob.upload_from_file(file_obj)
+                self._upload_buffer(blob, file_obj)
                 return
             if self.engine == "pandas" and isinstance(object_to_upload, pd.DataFrame):
                 csv_kwargs = kwargs.copy()
+                if csv_kwargs.pop("use_arrow", False):
+                    file_obj = self._arrow_csv(object_to_upload, **csv_kwargs)
+                    self._upload_buffer(blob, file_obj, content_type="text/plain")
+                    return
                 csv_kwargs.setdefault("encoding", "utf-8")
                 csv_kwargs.setdefault("index", False)
-                csv_string = object_to_upload.to_csv(**csv_kwargs)
-                blob.upload_from_string(csv_string)
+                # Encode straight into a bytes buffer instead of building an intermediate str
+                file_obj = io.BytesIO()
+                object_to_upload.to_csv(file_obj, **csv_kwargs)
+                self._upload_buffer(blob, file_obj, content_type="text/plain")
                 return
 
         elif file_extension == "xlsx":
@@ -779,21 +1172,22 @@ class GCSFileIO(BaseModule):
                 xlsx_kwargs = kwargs.copy()
                 file_obj = io.BytesIO()
                 object_to_upload.write_excel(file_obj, **xlsx_kwargs)
-                file_obj.seek(0)
-                blob.upload_from_file(file_obj)
+                self._upload_buffer(blob, file_obj)
                 return
             if self.engine == "pandas" and isinstance(object_to_upload, pd.DataFrame):
                 xlsx_kwargs = kwargs.copy()
                 xlsx_kwargs.setdefault("index", False)
                 file_obj = io.BytesIO()
                 object_to_upload.to_excel(file_obj, **xlsx_kwargs)
-                file_obj.seek(0)
-                blob.upload_from_file(file_obj)
+                self._upload_buffer(blob, file_obj)
                 return
 
-        elif file_extension == "json" and isinstance(object_to_upload, str):
-            json_string = json.dumps(object_to_upload)
-            blob.upload_from_string(json_string)
+        elif file_extension == "json" and isinstance(object_to_upload, (dict, list, str)):
+            if isinstance(object_to_upload, str):  # Already serialized
+                payload = object_to_upload.encode("utf-8")
+            else:
+                payload = self._dump_json(object_to_upload)
+            blob.upload_from_string(payload, content_type="application/json")
             return
 
         msg = (
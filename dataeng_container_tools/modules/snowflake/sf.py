@@ -5,7 +5,8 @@ This module can connect to a Snowflake table and execute a custom query.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, cast
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
@@ -15,9 +16,35 @@ from dataeng_container_tools.secrets_manager import SecretLocations
 
 if TYPE_CHECKING:
     import os
-    from types import TracebackType
+    from collections.abc import Iterable, Iterator, Sequence
+    from types import ModuleType, TracebackType
 
+    import pandas as pd
+    import pyarrow as pa
     from snowflake.connector.connection import SnowflakeConnection
+    from snowflake.connector.cursor import SnowflakeCursor
+
+
+@cache
+def _snowflake_connector() -> ModuleType:
+    """Lazily imports snowflake.connector once and returns the module."""
+    import snowflake.connector
+
+    return snowflake.connector
+
+
+@lru_cache(maxsize=8)
+def _pem_to_der_pkcs8(pem: str) -> bytes:
+    """Converts a PEM private key to unencrypted PKCS8 DER bytes, cached across reconnects."""
+    return serialization.load_pem_private_key(
+        pem.encode("utf-8"),
+        password=None,
+        backend=default_backend(),
+    ).private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
 
 
 class Snowflake(BaseModule):
@@ -33,6 +60,8 @@ class Snowflake(BaseModule):
         warehouse: Snowflake warehouse the user wants to connect to
     """
 
+    __slots__ = ("_cursor", "account", "ctx", "database", "role", "schema", "user", "warehouse")
+
     MODULE_NAME: ClassVar[str] = "SF"
     DEFAULT_SECRET_PATHS: ClassVar[dict[str, str]] = {
         "SF": "/vault/secrets/sf-key-pair.json",
@@ -41,6 +70,10 @@ class Snowflake(BaseModule):
         "SF_LEGACY_ALT": "/vault/secrets/sf_creds.json",
     }
 
+    DEFAULT_MAX_WORKERS: Final = 8
+    DEFAULT_PREFETCH_THREADS: Final = 8
+    ASYNC_POLL_INTERVAL: Final = 0.5  # Seconds
+
     def __init__(
         self,
         account: str,
@@ -54,8 +87,28 @@ class Snowflake(BaseModule):
         use_file_fallback: bool = True,
         **kwargs: Any,
     ) -> None:
-        """Initialize a snowflake connection."""
-        import snowflake.connector as sc
+        """Initialize a snowflake connection.
+
+        Args:
+            account: Snowflake account used for connection.
+            database: Snowflake database to connect to.
+            schema: Snowflake schema to connect to.
+            warehouse: Snowflake warehouse to connect to.
+            role: Snowflake role needed for connection.
+            sf_secret_location: Path to the Snowflake credentials JSON file.
+            use_cla_fallback: If True, attempts to use command-line arguments
+                as a fallback for the secret location.
+            use_file_fallback: If True, attempts to use the default secret file paths
+                as a fallback if other sources fail.
+            **kwargs: Additional keyword arguments passed to `snowflake.connector.connect`.
+                `query_tag` is applied as the `QUERY_TAG` session parameter and
+                `client_prefetch_threads` defaults to `DEFAULT_PREFETCH_THREADS`.
+
+        Raises:
+            FileNotFoundError: If Snowflake credentials are not found.
+            TypeError: If the Snowflake credentials are not JSON.
+        """
+        sc = _snowflake_connector()
 
         # Build list of secret paths in order of precedence
         secret_paths = [sf_secret_location]
@@ -84,19 +137,14 @@ class Snowflake(BaseModule):
 
         # Handle both password and private key authentication
         private_key = sf_creds.get("rsa_private_key")
-        private_key_bytes = (
-            serialization.load_pem_private_key(
-                private_key.encode("utf-8"),
-                password=None,
-                backend=default_backend(),
-            ).private_bytes(
-                encoding=serialization.Encoding.DER,
-                format=serialization.PrivateFormat.PKCS8,
-                encryption_algorithm=serialization.NoEncryption(),
-            )
-            if private_key
-            else None
-        )
+        private_key_bytes = _pem_to_der_pkcs8(private_key) if private_key else None
+
+        # The connector has no query_tag argument, set it as a session parameter so it labels every query
+        session_parameters = dict(kwargs.pop("session_parameters", None) or {})
+        query_tag = kwargs.pop("query_tag", None)
+        if query_tag is not None:
+            session_parameters.setdefault("QUERY_TAG", query_tag)
+        kwargs.setdefault("client_prefetch_threads", self.DEFAULT_PREFETCH_THREADS)
 
         self.ctx: SnowflakeConnection = sc.connect(
             user=self.user,
@@ -107,19 +155,283 @@ class Snowflake(BaseModule):
             schema=schema,
             warehouse=warehouse,
             role=role,
+            session_parameters=session_parameters,
             **kwargs,
         )
 
-    def execute(self, query: str) -> list[tuple] | list[dict]:
-        """Executes a query and returns the results."""
+        # Reused by the synchronous execute methods instead of allocating a cursor per query
+        self._cursor: SnowflakeCursor = self.ctx.cursor()
+
+    def execute(
+        self,
+        query: str,
+        params: Sequence[Any] | dict[str, Any] | None = None,
+        *,
+        fetch: Literal["rows", "columns", "pandas", "arrow"] = "rows",
+    ) -> list[tuple] | list[dict] | dict[str, list] | pd.DataFrame | pa.Table:
+        """Executes a query and returns the results.
+
+        Args:
+            query: The SQL query to execute.
+            params: Values bound to the query's placeholders (e.g. `%s` or `%(name)s`)
+                instead of interpolating them into the SQL string.
+            fetch: How the results are returned. "rows" returns a list of rows,
+                "columns" a dict of column name to list of values, "pandas" a
+                `pandas.DataFrame` and "arrow" a `pyarrow.Table`. The "pandas" and
+                "arrow" options build the result directly from Arrow result batches
+                instead of creating a Python object per cell, and are recommended for
+                large results. "columns" also starts from Arrow and skips the per-row
+                tuples. "rows" is the default for backwards compatibility.
+
+        Returns:
+            The query results in the format selected by `fetch`.
+
+        Note:
+            `execute` and `execute_many` share one cursor per connection, so they should
+            not be called from several threads at once. Use `execute_all` for concurrency.
+        """
+        self._cursor.execute(query, params)
+        return self._fetch(self._cursor, fetch)
+
+    @staticmethod
+    def _fetch(
+        cursor: SnowflakeCursor,
+        fetch: Literal["rows", "columns", "pandas", "arrow"],
+    ) -> list[tuple] | list[dict] | dict[str, list] | pd.DataFrame | pa.Table:
+        """Helper to fetch every result of an executed cursor in the requested format."""
+        if fetch == "pandas":
+            return cursor.fetch_pandas_all()
+        if fetch == "arrow":
+            return cursor.fetch_arrow_all(force_return_table=True)
+        if fetch == "columns":
+            return cursor.fetch_arrow_all(force_return_table=True).to_pydict()
+        return cursor.fetchall()
+
+    def execute_iter(self, query: str, params: Sequence[Any] | dict[str, Any] | None = None) -> Iterator[tuple]:
+        """Executes a query and yields result rows one result batch at a time.
+
+        Only one result batch is held in memory at a time, so large results can be
+        processed without buffering the whole result set like `execute`.
+
+        Args:
+            query: The SQL query to execute.
+            params: Values bound to the query's placeholders.
+
+        Yields:
+            The result rows as tuples.
+        """
+        cursor = self.ctx.cursor()
+        try:
+            cursor.execute(query, params)
+            batches = cursor.get_result_batches() or []
+        finally:
+            cursor.close()
+
+        for batch in batches:
+            yield from batch
+
+    def execute_stream(
+        self,
+        query: str,
+        params: Sequence[Any] | dict[str, Any] | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Executes a query and yields the results as Arrow record batches as they are downloaded.
+
+        The connector prefetches result chunks in background threads (tune with the
+        `client_prefetch_threads` connection keyword), so processing a batch overlaps
+        with downloading the next ones and only a few chunks are held in memory.
+
+        Args:
+            query: The SQL query to execute.
+            params: Values bound to the query's placeholders.
+
+        Yields:
+            `pyarrow.RecordBatch` objects in result order.
+        """
+        cursor = self.ctx.cursor()
+        try:
+            cursor.execute(query, params)
+            for table in cursor.fetch_arrow_batches():
+                yield from table.to_batches()
+        finally:
+            cursor.close()
+
+    def execute_batches_parallel(
+        self,
+        query: str,
+        params: Sequence[Any] | dict[str, Any] | None = None,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> pa.Table:
+        """Executes a query and downloads its result batches concurrently into a single Arrow table.
+
+        Each result batch is an independent download, so fetching them on a thread
+        pool is faster than the sequential fetch used by `execute` for large results.
+
+        Args:
+            query: The SQL query to execute.
+            params: Values bound to the query's placeholders.
+            max_workers: Maximum number of result batches downloaded at once.
+
+        Returns:
+            A `pyarrow.Table` with every result row, in result order.
+
+        Raises:
+            TypeError: If the result was returned in the JSON format, which has no Arrow batches.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        import pyarrow as pa
+        from snowflake.connector.result_batch import ArrowResultBatch
+
+        cursor = self.ctx.cursor()
+        try:
+            cursor.execute(query, params)
+            batches = cursor.get_result_batches() or []
+            if not batches:  # Keep the result schema for empty results
+                return cursor.fetch_arrow_all(force_return_table=True)
+        finally:
+            cursor.close()
+
+        if not all(isinstance(batch, ArrowResultBatch) for batch in batches):
+            msg = (
+                "Query results were returned as JSON, which cannot be converted to Arrow. "
+                "Use execute_iter instead, or set the PYTHON_CONNECTOR_QUERY_RESULT_FORMAT session parameter to ARROW."
+            )
+            raise TypeError(msg)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            tables = list(executor.map(lambda batch: batch.to_arrow(), batches))
+
+        # Batches of the same NUMBER column can arrive with different integer widths
+        return pa.concat_tables(tables, promote_options="default")
+
+    def execute_all(
+        self,
+        queries: Iterable[str],
+        *,
+        fetch: Literal["rows", "columns", "pandas", "arrow"] = "rows",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[list[tuple] | list[dict] | dict[str, list] | pd.DataFrame | pa.Table]:
+        """Executes independent queries concurrently, each on its own cursor.
+
+        Args:
+            queries: The SQL queries to execute.
+            fetch: How the results are returned, see `execute`.
+            max_workers: Maximum number of queries running at once.
+
+        Returns:
+            The results of each query, in the same order as `queries`.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def execute_one(query: str) -> list[tuple] | list[dict] | dict[str, list] | pd.DataFrame | pa.Table:
+            cursor = self.ctx.cursor()
+            try:
+                cursor.execute(query)
+                return self._fetch(cursor, fetch)
+            finally:
+                cursor.close()
+
+        queries = list(queries)
+        if not queries:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(execute_one, queries))
+
+    def execute_async(self, query: str, params: Sequence[Any] | dict[str, Any] | None = None) -> str:
+        """Submits a query without waiting for it to finish.
+
+        Several queries can be submitted back to back so they run concurrently on
+        the warehouse, then collected with `fetch_result`.
+
+        Args:
+            query: The SQL query to execute.
+            params: Values bound to the query's placeholders.
+
+        Returns:
+            The Snowflake query ID.
+        """
         cursor = self.ctx.cursor()
         try:
-            cursor.execute(query)
-            result = cursor.fetchall()
+            cursor.execute_async(query, params)
+            query_id = cursor.sfqid
+        finally:
+            cursor.close()
+        return cast("str", query_id)
+
+    def fetch_result(
+        self,
+        query_id: str,
+        *,
+        fetch: Literal["rows", "columns", "pandas", "arrow"] = "rows",
+    ) -> list[tuple] | list[dict] | dict[str, list] | pd.DataFrame | pa.Table:
+        """Waits for a query submitted with `execute_async` and returns its results.
+
+        Args:
+            query_id: The query ID returned by `execute_async`.
+            fetch: How the results are returned, see `execute`.
+
+        Returns:
+            The query results in the format selected by `fetch`.
+        """
+        cursor = self.ctx.cursor()
+        try:
+            cursor.get_results_from_sfqid(query_id)  # Blocks until the query finishes
+            result = self._fetch(cursor, fetch)
         finally:
             cursor.close()
         return result
 
+    async def execute_awaitable(
+        self,
+        query: str,
+        params: Sequence[Any] | dict[str, Any] | None = None,
+        *,
+        fetch: Literal["rows", "columns", "pandas", "arrow"] = "rows",
+    ) -> list[tuple] | list[dict] | dict[str, list] | pd.DataFrame | pa.Table:
+        """Executes a query without blocking the event loop while it runs.
+
+        The query status is polled with `asyncio.sleep` in between, so many queries
+        can be awaited together, e.g. with `asyncio.gather`.
+
+        Args:
+            query: The SQL query to execute.
+            params: Values bound to the query's placeholders.
+            fetch: How the results are returned, see `execute`.
+
+        Returns:
+            The query results in the format selected by `fetch`.
+        """
+        import asyncio
+
+        query_id = await asyncio.to_thread(self.execute_async, query, params)
+        while True:  # The status is only known remotely, there is no local event to await
+            status = await asyncio.to_thread(self.ctx.get_query_status, query_id)
+            if not self.ctx.is_still_running(status):
+                break
+            await asyncio.sleep(self.ASYNC_POLL_INTERVAL)
+
+        # Raises if the query failed, then download the results off the event loop
+        return await asyncio.to_thread(self.fetch_result, query_id, fetch=fetch)
+
+    def execute_many(self, query: str, seq_of_params: Sequence[Sequence[Any] | dict[str, Any]]) -> int:
+        """Executes a query once for each set of parameters.
+
+        Multi-row INSERTs are sent to Snowflake as a single batched statement
+        rather than one round-trip per row.
+
+        Args:
+            query: The SQL query to execute, containing placeholders.
+            seq_of_params: A sequence of parameter sets, one per execution.
+
+        Returns:
+            The number of rows affected.
+        """
+        self._cursor.executemany(query, seq_of_params)
+        return self._cursor.rowcount or 0
+
     def __enter__(self) -> Snowflake:
         """Context manager."""
         return self
@@ -131,4 +443,5 @@ class Snowflake(BaseModule):
         exc_tb: TracebackType | None,
     ) -> None:
         """Context manager wrapper for closing Snowflake."""
+        self._cursor.close()
         self.ctx.__exit__(exc_type, exc_val, exc_tb)
@@ -1,11 +1,9 @@
 """A modified version of standard I/O for censoring secrets.
 
 Ensures that secrets are not accidentally printed using stdout or stderr. Has one
-class SafeTextIO, two helper methods, add_secrets_folder and setup_default_stdio,
-and one global variable default_secret_folder. On import it automatically searches
-for secret files and adds their contents to the list of terms to censor. Also contains
-global variables containing the default secret folder, the default GCS secret location,
-and the list of secret files automatically found in the default secret folder.
+class SafeTextIO and one helper function, setup_default_stdio. On import it wraps
+`sys.stdout` and `sys.stderr` with SafeTextIO; the words to censor are added by
+SecretManager as secret files are parsed.
 """
 
 from __future__ import annotations
@@ -14,6 +12,7 @@ import json
 import logging
 import re
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING, ClassVar, Protocol, TextIO
 
 if TYPE_CHECKING:
@@ -53,9 +52,11 @@ class SafeTextIO(TextIO):
 
     Attributes:
         _bad_words (ClassVar[set[str]]): A set of strings to be censored.
-        _pattern_cache (ClassVar[tuple[re.Pattern, int]]): Cache for the compiled
-            regex pattern used for censoring, along with a version number to
-            track changes to `_bad_words`.
+        _pattern_cache (ClassVar[tuple[re.Pattern, frozenset[str], int, set[str], int]]): Cache
+            for the compiled regex pattern used for censoring, the first characters of
+            every bad word and the length of the shortest one, along with the `_bad_words`
+            set and size they were built from to track changes to `_bad_words`.
+        _STARS (ClassVar[str]): A run of asterisks sliced to build each censored replacement.
 
     Examples:
         Using with `io.StringIO`:
@@ -82,8 +83,17 @@ class SafeTextIO(TextIO):
             >>> os.remove(file_path) # Clean up
     """
 
+    __slots__ = ("__old_textio_write",)
+
     _bad_words: ClassVar[set[str]] = set()
-    _pattern_cache: ClassVar[tuple[re.Pattern, int]] = (re.compile(""), 0)  # Track int "version" of _bad_words
+    _pattern_cache: ClassVar[tuple[re.Pattern, frozenset[str], int, set[str], int]] = (
+        re.compile(""),
+        frozenset(),
+        0,
+        _bad_words,
+        0,  # Track int "version" of _bad_words
+    )
+    _STARS: ClassVar[str] = "*" * 8192  # Sliced for censoring, secrets are almost always shorter
 
     def __init__(self, textio: TextIO, bad_words: Iterable[str | SupportsStr] = []) -> None:
         """Initializes a SafeTextIO instance.
@@ -114,43 +124,116 @@ class SafeTextIO(TextIO):
             The number of characters written, as returned by the underlying
             TextIO object's write method.
         """
-        # ruff: noqa: SLF001
-        # Remove above noqa when https://github.com/astral-sh/ruff/issues/17197 is fixed
-
         message_str = str(message)
+        old_textio_write = self.__old_textio_write
+        cls = self.__class__
 
         # Skip processing if no bad words
-        if not self.__class__._bad_words:
-            return self.__old_textio_write(message_str)
+        if not cls._bad_words:
+            return old_textio_write(message_str)
 
-        # Version will be the length, assume can only add words to _bad_words (no remove or modify)
-        # Computing this is far easier than set comparison
-        words_version = len(self.__class__._bad_words)
+        pattern, first_chars, min_length = cls._get_pattern()
+
+        # Most messages contain no secrets, skip the regex unless a bad word could fit and start somewhere
+        if len(message_str) < min_length or first_chars.isdisjoint(message_str):
+            return old_textio_write(message_str)
+
+        # Replace all bad words in one pass, slicing shared asterisks instead of building a new string per match
+        stars = cls._STARS
+
+        def censor(match: re.Match[str]) -> str:
+            length = match.end() - match.start()
+            if length <= len(stars):
+                return stars[:length]
+            return "*" * length  # Longer than the shared asterisks
 
-        # Cache hit check
-        pattern, cached_version = self.__class__._pattern_cache
-        if cached_version != words_version:  # Cache miss - rebuild the pattern
-            # Sort by length descending to handle overlapping patterns correctly
-            bad_words_sorted = sorted(self.__class__._bad_words, key=len, reverse=True)
-            pattern_str = "|".join(re.escape(word) for word in bad_words_sorted)
+        censored_message = pattern.sub(censor, message_str)
+
+        return old_textio_write(censored_message)
+
+    @classmethod
+    def _get_pattern(cls) -> tuple[re.Pattern, frozenset[str], int]:
+        """Returns the censoring pattern, bad word first characters and minimum length, rebuilding them if stale.
+
+        Returns:
+            The compiled alternation of all bad words, the set of their first characters
+            and the length of the shortest one.
+        """
+        pattern, first_chars, min_length, cached_words, cached_version = cls._pattern_cache
+
+        # Version will be the length, assume can only add words to _bad_words (no remove or modify)
+        # Computing this is far easier than set comparison, the identity check catches a replaced set
+        if cached_words is not cls._bad_words or cached_version != len(cls._bad_words):  # Cache miss
+            words = cls._bad_words
+            pattern = re.compile(cls.__trie_pattern(word for word in words if word))
+            first_chars = frozenset(word[0] for word in words if word)
+            min_length = min((len(word) for word in words if word), default=0)
 
             # Update cache
-            pattern = re.compile(pattern_str)
-            self.__class__._pattern_cache = (pattern, cached_version)
+            cls._pattern_cache = (pattern, first_chars, min_length, words, len(words))
+
+        return pattern, first_chars, min_length
 
-        # Replace all bad words in one pass
-        censored_message = pattern.sub(lambda match: "*" * len(match.group(0)), message_str)
+    @staticmethod
+    def __trie_pattern(words: Iterable[str]) -> str:
+        """Builds a regex matching any of the words, structured as a prefix trie.
+
+        A flat `w1|w2|...` alternation retries every word at every position. Sharing
+        common prefixes means each position is checked against at most one path
+        through the trie. Greedy optional groups prefer the longest word, matching
+        the behavior of a longest-first alternation for overlapping words.
 
-        return self.__old_textio_write(censored_message)
+        Args:
+            words: The non-empty words to match.
+
+        Returns:
+            The regex pattern string.
+        """
+        trie: dict[str, dict] = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}  # Marks the end of a word
+
+        def build(node: dict[str, dict]) -> str:
+            branches = []
+            for char, child in sorted(node.items()):
+                if not char:
+                    continue
+                # Collapse chains of single-child nodes into one literal to keep nesting shallow
+                literal = [char]
+                tail = child
+                while len(tail) == 1 and "" not in tail:
+                    ((next_char, tail),) = tail.items()
+                    literal.append(next_char)
+                branches.append(re.escape("".join(literal)) + build(tail))
+
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            if "" in node:  # A word may end here, but prefer continuing to a longer one
+                return body + "?" if len(branches) == 1 and len(body) == 1 else "(?:" + body + ")?"
+            return body
+
+        return build(trie)
 
     @staticmethod
-    def __get_word_variants(word: str) -> set[str]:
-        return {
-            word,
-            json.dumps(word),  # JSON dump, e.g. "word"
-            json.dumps(word).encode("unicode-escape").decode(),
-            word.encode("unicode-escape").decode(),
-        }
+    @lru_cache(maxsize=4096)
+    def __get_word_variants(word: str) -> frozenset[str]:
+        # Printable ASCII without quotes or backslashes is never escaped, skip the encoders
+        if word.isascii() and word.isprintable() and '"' not in word and "\\" not in word:
+            return frozenset((word, f'"{word}"'))
+
+        json_word = json.dumps(word)  # JSON dump, e.g. "word"
+        return frozenset(
+            (
+                word,
+                json_word,
+                json_word.encode("unicode-escape").decode(),
+                word.encode("unicode-escape").decode(),
+            ),
+        )
 
     @classmethod
     def add_words(cls, bad_words: Iterable[str | SupportsStr]) -> None:
@@ -176,14 +259,8 @@ class SafeTextIO(TextIO):
                 Testing *********** and **************.
 
         """
-        cls._bad_words.update(
-            {
-                variant
-                for word in bad_words
-                if str(word) not in cls._bad_words  # Skip if already censored
-                for variant in cls.__get_word_variants(str(word))
-            },
-        )
+        new_words = {str(word) for word in bad_words}.difference(cls._bad_words)  # Skip if already censored
+        cls._bad_words.update(variant for word in new_words for variant in cls.__get_word_variants(word))
 
 
 def setup_default_stdio() -> None:
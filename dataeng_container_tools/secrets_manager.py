@@ -4,17 +4,31 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Final, final
 
 from .safe_textio import SafeTextIO
 
 if TYPE_CHECKING:
-    import os
+    from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger("Container Tools")
 
 
+def _load_json(content: str | bytes) -> Any:  # noqa: ANN401
+    """Helper to decode JSON with orjson when installed, otherwise the standard library.
+
+    `orjson.JSONDecodeError` subclasses `json.JSONDecodeError`, so callers handle both alike.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(content)
+    return orjson.loads(content)
+
+
 class SecretManager:
     """Manages secret files and their contents.
 
@@ -24,14 +38,17 @@ class SecretManager:
 
     Attributes:
         DEFAULT_SECRET_FOLDER: Default directory path for secret files.
+        MAX_READ_WORKERS: Maximum number of secret files read at once by `process_secret_folder`.
         files: List of all processed secret file paths.
         secrets: Dictionary mapping file paths to their parsed content.
     """
 
     DEFAULT_SECRET_FOLDER: Final = Path("/vault/secrets/")
+    MAX_READ_WORKERS: Final = 16
+    _JSON_DELIMITERS: Final = frozenset(((b"{", b"}"), (b"[", b"]")))
 
     files: ClassVar[list[Path]] = []
-    secrets: ClassVar[dict[str, str | dict]] = {}
+    secrets: ClassVar[dict[str, str | dict | list]] = {}
 
     @classmethod
     def parse_secret(
@@ -40,12 +57,12 @@ class SecretManager:
         *,
         update_bad_words: bool = True,
         verbose: bool = True,
-    ) -> str | dict | None:
-        """Parses the content of a secret file and returns it as a string or dictionary.
+    ) -> str | dict | list | None:
+        """Parses the content of a secret file and returns it as a string, dictionary or list.
 
         This method reads the content of the file specified by the given file path.
-        If the content is a valid JSON object, it is parsed and returned as a dictionary.
-        Otherwise, the content is returned as a stripped string.
+        If the content is a valid JSON object or array, it is parsed and returned as a
+        dictionary or list. Otherwise, the content is returned as a stripped string.
 
         Args:
             file: The path to the secret file to be parsed.
@@ -55,11 +72,11 @@ class SecretManager:
                 Defaults to True.
 
         Returns:
-            The content of the file as a dictionary if it is a valid JSON object,
-            otherwise as a stripped string. None if the file path is invalid.
+            The content of the file as a dictionary or list if it is a valid JSON object
+            or array, otherwise as a stripped string. None if the file path is invalid.
 
         Raises:
-            json.JSONDecodeError: If the content is not a properly formatted JSON object
+            json.JSONDecodeError: If the content is not a properly formatted JSON object or array
                 and an attempt to parse it as JSON is made.
 
         Examples:
@@ -71,32 +88,45 @@ class SecretManager:
                 >>> SecretManager.parse_secret("/vault/secrets/database_json")
                 {"host": "db.example.com", "port": 1234, "username": "user"}
         """
-        file_path = Path(file)
+        file_path = file if isinstance(file, Path) else Path(file)
+        content = cls._read_secret(file_path, verbose=verbose)
+        if content is None:
+            return None
+
+        # Add secrets to variables and bad words
+        cls.secrets[file_path.as_posix()] = content
+        cls.files.append(file_path)
+
+        if update_bad_words:
+            cls.update_bad_words([content])
+
+        return content
+
+    @classmethod
+    def _read_secret(cls, file_path: Path, *, verbose: bool) -> str | dict | list | None:
+        """Helper to read and decode a secret file without registering it."""
         if not file_path.exists():
             return None
 
-        # Parse secret as str text
+        # Read secret as bytes, only decoded to str text when it is not JSON
         try:
-            content: str = file_path.read_text().strip()
+            raw = file_path.read_bytes().strip()
         except OSError:
             if verbose:
                 logger.exception("File %s cannot be read.", file_path.as_posix())
             return None
 
         # Try optimistically parsing as JSON
-        try:
-            if content.startswith("{") and content.endswith("}"):
-                content = json.loads(content)  # JSON objects are always considered dicts according to JSONDecoder class
-        except json.JSONDecodeError:
-            if verbose:
-                logger.exception("File %s is not a properly formatted JSON file.", file_path.as_posix())
-
-        # Add secrets to variables and bad words
-        cls.secrets[file_path.as_posix()] = content
-        cls.files.append(file_path)
-
-        if update_bad_words:
-            cls.update_bad_words()
+        content: str | dict | list
+        if (raw[:1], raw[-1:]) in cls._JSON_DELIMITERS:
+            try:
+                content = _load_json(raw)  # JSON objects and arrays are decoded as dicts and lists
+            except json.JSONDecodeError:
+                if verbose:
+                    logger.exception("File %s is not a properly formatted JSON file.", file_path.as_posix())
+                content = raw.decode("utf-8")
+        else:
+            content = raw.decode("utf-8")
 
         return content
 
@@ -126,26 +156,75 @@ class SecretManager:
             )
             return
 
-        files = [file_path for file_path in folder_path.glob("**/*") if file_path.is_file()]
-        logger.info("Found these secret files: %s", [file.as_posix() for file in files])
-        for file in files:
-            cls.parse_secret(file, update_bad_words=False)
+        files = list(cls._walk_files(folder_path))
+        if logger.isEnabledFor(logging.INFO):  # Skip building the file list when it would not be logged
+            logger.info("Found these secret files: %s", [file.as_posix() for file in files])
+        if not files:
+            return
+
+        # Reads are I/O bound, overlap them and register the results in file order
+        with ThreadPoolExecutor(max_workers=min(cls.MAX_READ_WORKERS, len(files))) as executor:
+            contents = list(executor.map(lambda file_path: cls._read_secret(file_path, verbose=True), files))
+
+        for file_path, content in zip(files, contents, strict=True):
+            if content is not None:
+                cls.secrets[file_path.as_posix()] = content
+                cls.files.append(file_path)
         cls.update_bad_words()
 
+    @staticmethod
+    def _walk_files(folder: str | os.PathLike[str]) -> Iterator[Path]:
+        """Helper to recursively yield every file in a folder.
+
+        Equivalent to `glob("**/*")` filtered by `is_file()`, but uses the file type cached
+        by `os.scandir` instead of building and stat'ing a `Path` for every entry. Like
+        `glob`, symlinked files are included and symlinked directories are not descended into.
+        """
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from SecretManager._walk_files(entry.path)
+                elif entry.is_file():
+                    yield Path(entry.path)
+
     @classmethod
-    def update_bad_words(cls) -> None:
+    def update_bad_words(cls, secrets: Iterable[str | dict | list] | None = None) -> None:
         """Update the bad words list for SafeTextIO with current secrets.
 
         This method extracts all secret values from the secrets registry and adds
         them to SafeTextIO's bad words list to prevent accidental logging or
         exposure of sensitive information.
+
+        Args:
+            secrets: Only add the values of these secrets, e.g. a newly parsed one.
+                Defaults to every secret in the registry.
         """
-        bad_words = set()
-        for secret in SecretManager.secrets.values():
-            these_bad_words = set(secret.values()) if isinstance(secret, dict) else {secret}
-            bad_words.update(these_bad_words)
+        if secrets is None:
+            secrets = cls.secrets.values()
+
+        bad_words: set[str] = set()
+        for secret in secrets:
+            bad_words.update(cls._secret_words(secret))
         SafeTextIO.add_words(bad_words)
 
+    @staticmethod
+    def _secret_words(secret: Any) -> Iterator[str]:  # noqa: ANN401
+        """Helper to yield the words to censor from a parsed secret.
+
+        Nested JSON objects and arrays are walked down to their values. Only non-empty
+        strings are kept; numbers, booleans and nulls (e.g. a port or retry count) would
+        mask every matching substring of unrelated output.
+        """
+        if isinstance(secret, dict):
+            secret = secret.values()
+        elif not isinstance(secret, list):
+            if secret and isinstance(secret, str):
+                yield secret
+            return
+
+        for value in secret:
+            yield from SecretManager._secret_words(value)
+
 
 @final
 class SecretLocations(dict[str, str]):
@@ -208,8 +287,7 @@ class SecretLocations(dict[str, str]):
         super().update(new_secret_locations)
 
         if set_attr:
-            for key, value in new_secret_locations.items():
-                setattr(self, key, value)
+            self.__dict__.update(new_secret_locations)  # No descriptors to honor, so skip per-key setattr
 
     @classmethod
     def register_module(cls, module_class: type[Any]) -> None:
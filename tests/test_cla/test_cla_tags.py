@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_file_path() -> Path:
     """Set up test fixtures."""
     return Path(__file__).parent / "mock_files" / "tags.py"
@@ -6,8 +6,10 @@ from pathlib import Path
 
 import pytest
 
+SECRET_LOCATIONS_ARGS = ("--secret_locations", '{"secret": "gs://test-bucket/secrets"}')
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_file_path() -> Path:
     """Set up test fixtures."""
     return Path(__file__).parent / "mock_files" / "required_optional_unused.py"
@@ -19,8 +21,7 @@ def test_standard_use(mock_file_path: Path) -> None:
         [
             sys.executable,
             str(mock_file_path),
-            "--secret_locations",
-            '{"secret": "gs://test-bucket/secrets"}',
+            *SECRET_LOCATIONS_ARGS,
             "--input_bucket_names",
             "input-bucket",
             "--input_paths",
@@ -68,8 +69,7 @@ def test_optional_missing(mock_file_path: Path) -> None:
         [
             sys.executable,
             str(mock_file_path),
-            "--secret_locations",
-            '{"secret": "gs://test-bucket/secrets"}',
+            *SECRET_LOCATIONS_ARGS,
             # input_files arguments are omitted but they're optional
         ],
         capture_output=True,
@@ -82,20 +82,31 @@ def test_optional_missing(mock_file_path: Path) -> None:
     )
 
 
-def test_unused_arguments_error(mock_file_path: Path) -> None:
-    """Test that unused arguments cause error when attempted to be used."""
+@pytest.mark.parametrize(
+    "unused_args",
+    [
+        pytest.param(
+            [
+                "--output_bucket_names",
+                "output-bucket",
+                "--output_paths",
+                "output/path",
+                "--output_filenames",
+                "result.csv",
+            ],
+            id="all",
+        ),
+        pytest.param(["--output_bucket_names", "output-bucket"], id="partial"),
+    ],
+)
+def test_unused_arguments_error(mock_file_path: Path, unused_args: list[str]) -> None:
+    """Test that unused arguments, even partially provided, cause error when attempted to be used."""
     result = subprocess.run(
         [
             sys.executable,
             str(mock_file_path),
-            "--secret_locations",
-            '{"secret": "gs://test-bucket/secrets"}',
-            "--output_bucket_names",
-            "output-bucket",
-            "--output_paths",
-            "output/path",
-            "--output_filenames",
-            "result.csv",
+            *SECRET_LOCATIONS_ARGS,
+            *unused_args,
         ],
         capture_output=True,
         text=True,
@@ -106,35 +117,13 @@ def test_unused_arguments_error(mock_file_path: Path) -> None:
     assert "unrecognized arguments" in result.stderr.lower()
 
 
-def test_unused_partial_arguments_error(mock_file_path: Path) -> None:
-    """Test that even partial unused arguments cause error."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            str(mock_file_path),
-            "--secret_locations",
-            '{"secret": "gs://test-bucket/secrets"}',
-            "--output_bucket_names",
-            "output-bucket",
-            # Only partial output arguments provided
-        ],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    assert result.returncode != 0, "Expected non-zero exit code when using any unused arguments"
-    assert "unrecognized arguments" in result.stderr.lower()
-
-
 def test_minimal_required_only(mock_file_path: Path) -> None:
     """Test that providing only required arguments works successfully."""
     result = subprocess.run(
         [
             sys.executable,
             str(mock_file_path),
-            "--secret_locations",
-            '{"secret": "gs://test-bucket/secrets"}',
+            *SECRET_LOCATIONS_ARGS,
         ],
         capture_output=True,
         text=True,
@@ -7,23 +7,27 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_file_path() -> Path:
     """Set up test fixtures."""
     return Path(__file__).parent / "mock_files" / "custom_cla.py"
 
 
-def test_custom_args_exist(mock_file_path: Path) -> None:
-    """Test that custom arguments with valid inputs execute successfully."""
-    # Test with valid inputs for both arguments
+@pytest.mark.parametrize(
+    "some_arg_values",
+    [
+        pytest.param(["value1", "value2", "value3"], id="three_values"),
+        pytest.param(["val1", "val2", "val3", "val4", "val5"], id="five_values"),
+    ],
+)
+def test_custom_args_exist(mock_file_path: Path, some_arg_values: list[str]) -> None:
+    """Test that custom arguments with valid inputs, including several nargs='+' values, execute successfully."""
     result = subprocess.run(
         [
             sys.executable,
             str(mock_file_path),
             "--some_arg",
-            "value1",
-            "value2",
-            "value3",
+            *some_arg_values,
             "--some_arg2",
             "42",
         ],
@@ -55,30 +59,6 @@ def test_wrong_type(mock_file_path: Path) -> None:
     assert "invalid int value" in result.stderr.lower()
 
 
-def test_custom_parameters(mock_file_path: Path) -> None:
-    """Test that nargs='+' functionality works correctly with multiple values."""
-    # Test with 5 arguments
-    result = subprocess.run(
-        [
-            sys.executable,
-            str(mock_file_path),
-            "--some_arg",
-            "val1",
-            "val2",
-            "val3",
-            "val4",
-            "val5",
-            "--some_arg2",
-            "123",
-        ],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    assert result.returncode == 0, f"Expected successful exit code with multiple args. stderr: {result.stderr}"
-
-
 def test_custom_parameters2(mock_file_path: Path) -> None:
     """Test that nargs='+' requires at least one value and fails appropriately."""
     result = subprocess.run(
@@ -28,8 +28,17 @@ def setup_gcs_testbench(request: pytest.FixtureRequest) -> Generator[None, None,
     if not isinstance(gcs_port, str):
         gcs_port = "9000"
 
+    # Each pytest-xdist worker (gw0, gw1, ...) runs its own testbench so buckets do not collide
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    gcs_port = str(int(gcs_port) + int(worker.removeprefix("gw")))
+
     os.environ["STORAGE_EMULATOR_HOST"] = f"http://localhost:{gcs_port}"
 
+    # Reuse a testbench that is already running on the port, e.g. one kept alive between local runs
+    if _is_gcs_ready(gcs_port):
+        yield None
+        return
+
     runner = Path(__file__).parent / "_helper" / "testbench_run.py"
     cmd = [sys.executable, runner.as_posix(), "localhost", gcs_port, "10"]
     process = subprocess.Popen(cmd)
@@ -41,7 +50,7 @@ def setup_gcs_testbench(request: pytest.FixtureRequest) -> Generator[None, None,
     while time.time() - start_time < timeout:
         if _is_gcs_ready(gcs_port):
             break
-        time.sleep(3)
+        time.sleep(0.5)
     else:
         process.terminate()
         msg = f"GCS testbench failed to start within {timeout} seconds"
@@ -1,6 +1,7 @@
 """Tests for the GCS download functionality."""
 
 import io
+import json
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
@@ -19,15 +20,15 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gcs_client() -> storage.Client:
     """Create a GCS client for the emulator."""
     return storage.Client()
 
 
-@pytest.fixture
-def test_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, None]:
-    """Create a test bucket."""
+@pytest.fixture(scope="module")
+def module_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, None]:
+    """Create the test bucket once for every test in this module."""
     bucket_name = "test-bucket-download"
     bucket = gcs_client.bucket(bucket_name)
 
@@ -36,19 +37,51 @@ def test_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, N
 
     yield bucket
 
-    # Cleanup: delete all blobs in bucket
-    blobs = list(bucket.list_blobs())
-    for blob in blobs:
-        blob.delete()
     bucket.delete()
 
 
 @pytest.fixture
+def test_bucket(gcs_client: storage.Client, module_bucket: storage.Bucket) -> Generator[storage.Bucket, None, None]:
+    """Provide the test bucket, emptied after each test."""
+    yield module_bucket
+
+    # Cleanup: delete all blobs in bucket in one batch request
+    blobs = list(module_bucket.list_blobs())
+    if blobs:  # An empty batch raises on exit
+        with gcs_client.batch():
+            for blob in blobs:
+                blob.delete()
+
+
+@pytest.fixture(scope="module")
 def gcs_file_io() -> GCSFileIO:
     """Create a GCSFileIO instance."""
     return GCSFileIO(local=True)
 
 
+@pytest.fixture(scope="module")
+def tabular_data() -> pd.DataFrame:
+    """Create the DataFrame shared by the tabular download tests."""
+    return pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+
+@pytest.fixture(scope="module")
+def tabular_payloads(tabular_data: pd.DataFrame) -> dict[str, bytes]:
+    """Serialize the shared DataFrame once per module for each tabular file extension."""
+    parquet_buffer = io.BytesIO()
+    tabular_data.to_parquet(parquet_buffer, index=False)
+
+    excel_buffer = io.BytesIO()
+    tabular_data.to_excel(excel_buffer, index=False)
+
+    return {
+        "parquet": parquet_buffer.getvalue(),
+        "csv": tabular_data.to_csv(index=False).encode(),
+        "xlsx": excel_buffer.getvalue(),
+        "json": tabular_data.to_json(orient="records").encode(),
+    }
+
+
 def test_gcs_file_io_init_local() -> None:
     """Test GCSFileIO initialization in local mode."""
     gcs_io = GCSFileIO(local=True)
@@ -117,19 +150,16 @@ def test_download_to_file_multiple(
 def test_download_to_object_parquet(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
+    tabular_data: pd.DataFrame,
+    tabular_payloads: dict[str, bytes],
 ) -> None:
     """Test downloading Parquet file to DataFrame object."""
-    # Setup: Create and upload a test parquet file
-    test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
-
-    # Create parquet bytes
-    parquet_buffer = io.BytesIO()
-    test_data.to_parquet(parquet_buffer, index=False)
-    parquet_bytes = parquet_buffer.getvalue()
+    # Setup: Upload a test parquet file
+    test_data = tabular_data
 
     blob_name = "test.parquet"
     blob = test_bucket.blob(blob_name)
-    blob.upload_from_string(parquet_bytes)
+    blob.upload_from_string(tabular_payloads["parquet"])
 
     # Test: Download the file as object
     test_uri = f"gs://{test_bucket.name}/{blob_name}"
@@ -143,18 +173,40 @@ def test_download_to_object_parquet(
     pd.testing.assert_frame_equal(result_data, test_data)
 
 
+def test_download_to_object_parquet_columns(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test downloading only selected columns of a Parquet file."""
+    # Setup: Create and upload a test Parquet file
+    test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [1.0, 2.0, 3.0]})
+    parquet_buffer = io.BytesIO()
+    test_data.to_parquet(parquet_buffer, index=False)
+
+    blob_name = "test_columns.parquet"
+    test_bucket.blob(blob_name).upload_from_string(parquet_buffer.getvalue())
+
+    # Test: Download only two of the columns
+    result = gcs_file_io.download(f"gs://{test_bucket.name}/{blob_name}", columns=["col1", "col3"])
+
+    # Verify: Only the requested columns are present
+    result_data = result[f"{test_bucket.name}/{blob_name}"]
+    pd.testing.assert_frame_equal(result_data, test_data[["col1", "col3"]])
+
+
 def test_download_to_object_csv(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
+    tabular_data: pd.DataFrame,
+    tabular_payloads: dict[str, bytes],
 ) -> None:
     """Test downloading CSV file to DataFrame object."""
-    # Setup: Create and upload a test CSV file
-    test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
-    csv_content = test_data.to_csv(index=False)
+    # Setup: Upload a test CSV file
+    test_data = tabular_data
 
     blob_name = "test.csv"
     blob = test_bucket.blob(blob_name)
-    blob.upload_from_string(csv_content)
+    blob.upload_from_string(tabular_payloads["csv"])
 
     # Test: Download the file as object
     test_uri = f"gs://{test_bucket.name}/{blob_name}"
@@ -168,22 +220,36 @@ def test_download_to_object_csv(
     pd.testing.assert_frame_equal(result_data, test_data)
 
 
-def test_download_to_object_xlsx(
+def test_download_to_object_csv_use_arrow(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
 ) -> None:
-    """Test downloading Excel file to DataFrame object."""
-    # Setup: Create and upload a test Excel file
+    """Test downloading CSV file with the pyarrow parser."""
+    # Setup: Create and upload a test CSV file
     test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    blob_name = "test_arrow.csv"
+    test_bucket.blob(blob_name).upload_from_string(test_data.to_csv(index=False))
 
-    # Create Excel bytes
-    excel_buffer = io.BytesIO()
-    test_data.to_excel(excel_buffer, index=False)
-    excel_bytes = excel_buffer.getvalue()
+    # Test: Download the file using the Arrow CSV parser
+    result = gcs_file_io.download(f"gs://{test_bucket.name}/{blob_name}", use_arrow=True)
+
+    # Verify: The parsed frame matches the original
+    pd.testing.assert_frame_equal(result[f"{test_bucket.name}/{blob_name}"], test_data)
+
+
+def test_download_to_object_xlsx(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+    tabular_data: pd.DataFrame,
+    tabular_payloads: dict[str, bytes],
+) -> None:
+    """Test downloading Excel file to DataFrame object."""
+    # Setup: Upload a test Excel file
+    test_data = tabular_data
 
     blob_name = "test.xlsx"
     blob = test_bucket.blob(blob_name)
-    blob.upload_from_string(excel_bytes)
+    blob.upload_from_string(tabular_payloads["xlsx"])
 
     # Test: Download the file as object
     test_uri = f"gs://{test_bucket.name}/{blob_name}"
@@ -200,15 +266,16 @@ def test_download_to_object_xlsx(
 def test_download_to_object_json(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
+    tabular_data: pd.DataFrame,
+    tabular_payloads: dict[str, bytes],
 ) -> None:
     """Test downloading JSON file to DataFrame object."""
-    # Setup: Create and upload a test JSON file
-    test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
-    json_content = test_data.to_json(orient="records")
+    # Setup: Upload a test JSON file
+    test_data = tabular_data
 
     blob_name = "test.json"
     blob = test_bucket.blob(blob_name)
-    blob.upload_from_string(json_content)
+    blob.upload_from_string(tabular_payloads["json"])
 
     # Test: Download the file as object
     test_uri = f"gs://{test_bucket.name}/{blob_name}"
@@ -222,42 +289,54 @@ def test_download_to_object_json(
     pd.testing.assert_frame_equal(result_data.reset_index(drop=True), test_data.reset_index(drop=True))
 
 
-def test_download_mixed_extensions(
+def test_download_to_object_json_as_python_object(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
 ) -> None:
-    """Test downloading files with various known extensions."""
-    # Setup: Create test data
-    test_data = pd.DataFrame({"col1": [1, 2], "col2": ["x", "y"]})
+    """Test downloading JSON file as a plain Python object instead of a DataFrame."""
+    # Setup: Upload a non-tabular JSON document
+    test_data = {"name": "config", "values": [1, 2, 3], "nested": {"enabled": True}}
+    blob_name = "config.json"
+    test_bucket.blob(blob_name).upload_from_string(json.dumps(test_data))
 
-    # Upload different file types
-    test_files = {}
+    # Test: Download the file without DataFrame conversion
+    test_uri = f"gs://{test_bucket.name}/{blob_name}"
+    result = gcs_file_io.download(test_uri, as_dataframe=False)
 
-    # Parquet
-    parquet_buffer = io.BytesIO()
-    test_data.to_parquet(parquet_buffer, index=False)
-    blob = test_bucket.blob("data.parquet")
-    blob.upload_from_string(parquet_buffer.getvalue())
-    test_files["data.parquet"] = test_data
+    # Verify: The parsed object round-trips
+    assert result[f"{test_bucket.name}/{blob_name}"] == test_data
 
-    # CSV
-    csv_content = test_data.to_csv(index=False)
-    blob = test_bucket.blob("data.csv")
-    blob.upload_from_string(csv_content)
-    test_files["data.csv"] = test_data
 
-    # Excel
-    excel_buffer = io.BytesIO()
-    test_data.to_excel(excel_buffer, index=False)
-    blob = test_bucket.blob("data.xlsx")
-    blob.upload_from_string(excel_buffer.getvalue())
-    test_files["data.xlsx"] = test_data
+def test_download_to_object_json_not_tabular(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test that JSON which cannot form a DataFrame is returned as the parsed object."""
+    # Setup: Upload a JSON object of scalar values
+    test_data = {"name": "config", "retries": 3, "enabled": True}
+    blob_name = "settings.json"
+    test_bucket.blob(blob_name).upload_from_string(json.dumps(test_data))
+
+    # Test: Download with the default options
+    result = gcs_file_io.download(f"gs://{test_bucket.name}/{blob_name}")
 
-    # JSON
-    json_content = test_data.to_json(orient="records")
-    blob = test_bucket.blob("data.json")
-    blob.upload_from_string(json_content)
-    test_files["data.json"] = test_data
+    # Verify: The parsed object is returned instead of raising
+    assert result[f"{test_bucket.name}/{blob_name}"] == test_data
+
+
+def test_download_mixed_extensions(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+    tabular_data: pd.DataFrame,
+    tabular_payloads: dict[str, bytes],
+) -> None:
+    """Test downloading files with various known extensions."""
+    # Setup: Upload different file types (Parquet, CSV, Excel and JSON)
+    test_files = {}
+    for extension, payload in tabular_payloads.items():
+        filename = f"data.{extension}"
+        test_bucket.blob(filename).upload_from_string(payload)
+        test_files[filename] = tabular_data
 
     # Test: Download all files
     uris = [f"gs://{test_bucket.name}/{filename}" for filename in test_files]
@@ -378,6 +457,29 @@ def test_download_with_wildcard(
     assert bin_result_data.getvalue() == binary_content
 
 
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        pytest.param("reports/sales_*.csv", ["reports/sales_01.csv", "reports/sales_02.csv"], id="literal-prefix"),
+        pytest.param("**/sales_01.csv", ["reports/sales_01.csv"], id="leading-wildcard"),
+        pytest.param("reports/sales_01.csv", ["reports/sales_01.csv"], id="no-wildcard"),
+    ],
+)
+def test_uri_to_blobs_glob(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+    pattern: str,
+    expected: list[str],
+) -> None:
+    """Test that globs only match their blobs when the listing is bounded to the literal prefix."""
+    for blob_name in ["reports/sales_01.csv", "reports/sales_02.csv", "reports/inventory_01.csv", "sales_03.csv"]:
+        test_bucket.blob(blob_name).upload_from_string("a\n1\n")
+
+    blobs = gcs_file_io.uri_to_blobs(f"gs://{test_bucket.name}/{pattern}")
+
+    assert sorted(blob.name for blob in blobs) == expected
+
+
 def test_download_with_dtype_parameter(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
@@ -409,3 +511,80 @@ def test_download_with_dtype_parameter(
     assert result_data["id"].dtype == "object"  # String type
     assert result_data["value"].dtype == "float64"
     pd.testing.assert_frame_equal(result_data, test_data)
+
+
+def test_download_iter(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test that download_iter yields every matched blob once, in listing order."""
+    # Setup: Upload more CSV files than the prefetch window
+    frames = {f"daily/day_{i:02d}.csv": pd.DataFrame({"day": [i], "value": [i * 10]}) for i in range(12)}
+    for blob_name, frame in frames.items():
+        test_bucket.blob(blob_name).upload_from_string(frame.to_csv(index=False))
+
+    # Test: Iterate a wildcard and an overlapping exact URI
+    uris = [f"gs://{test_bucket.name}/daily/*.csv", f"gs://{test_bucket.name}/daily/day_00.csv"]
+    results = list(gcs_file_io.download_iter(uris))
+
+    # Verify: Each blob is yielded once and parsed
+    assert [key for key, _ in results] == [f"{test_bucket.name}/{blob_name}" for blob_name in sorted(frames)]
+    for (_, result_data), blob_name in zip(results, sorted(frames), strict=True):
+        assert isinstance(result_data, pd.DataFrame)
+        pd.testing.assert_frame_equal(result_data, frames[blob_name])
+
+
+def test_download_dataset_parquet(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test downloading multiple Parquet files into a single dataset with column projection."""
+    # Setup: Upload Parquet files sharing a schema
+    parts = {
+        "part-0.parquet": pd.DataFrame({"id": [1, 2], "region": ["US", "EU"], "amount": [10, 20]}),
+        "part-1.parquet": pd.DataFrame({"id": [3, 4], "region": ["US", "EU"], "amount": [30, 40]}),
+    }
+    for filename, content in parts.items():
+        parquet_buffer = io.BytesIO()
+        content.to_parquet(parquet_buffer, index=False)
+        test_bucket.blob(filename).upload_from_string(parquet_buffer.getvalue())
+
+    # Non-parquet blobs matching the glob are skipped
+    test_bucket.blob("part-2.bin").upload_from_string(b"binary data")
+
+    # Test: Download as a single dataset, reading only some columns
+    dataset = gcs_file_io.download_dataset(f"gs://{test_bucket.name}/part-*", columns=["id", "amount"])
+    result_data = dataset.to_table().to_pandas().sort_values("id").reset_index(drop=True)
+
+    # Verify: Rows from every file are present with only the projected columns
+    expected_data = pd.concat(parts.values(), ignore_index=True)[["id", "amount"]]
+    pd.testing.assert_frame_equal(result_data, expected_data)
+
+
+def test_download_dataset_overlapping_globs(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test that a Parquet blob matched by several URIs is only read into the dataset once."""
+    # Setup: Upload a single Parquet file
+    test_data = pd.DataFrame({"id": [1, 2, 3]})
+    parquet_buffer = io.BytesIO()
+    test_data.to_parquet(parquet_buffer, index=False)
+    test_bucket.blob("part-0.parquet").upload_from_string(parquet_buffer.getvalue())
+
+    # Test: Download with a glob and an exact URI matching the same blob
+    dataset = gcs_file_io.download_dataset(
+        [f"gs://{test_bucket.name}/part-*.parquet", f"gs://{test_bucket.name}/part-0.parquet"],
+    )
+
+    # Verify: Rows are not duplicated
+    pd.testing.assert_frame_equal(dataset.to_table().to_pandas(), test_data)
+
+
+def test_download_dataset_no_match(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test that downloading a dataset with no matching Parquet blobs raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        gcs_file_io.download_dataset(f"gs://{test_bucket.name}/missing-*.parquet")
@@ -25,15 +25,15 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gcs_client() -> storage.Client:
     """Create a GCS client for the emulator."""
     return storage.Client()
 
 
-@pytest.fixture
-def test_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, None]:
-    """Create a test bucket."""
+@pytest.fixture(scope="module")
+def module_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, None]:
+    """Create the test bucket once for every test in this module."""
     bucket_name = "test-bucket-mixed-polars"
     bucket = gcs_client.bucket(bucket_name)
 
@@ -43,14 +43,23 @@ def test_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, N
 
     yield bucket
 
-    # Cleanup: delete all blobs in bucket
-    blobs = list(bucket.list_blobs())
-    for blob in blobs:
-        blob.delete()
     bucket.delete()
 
 
 @pytest.fixture
+def test_bucket(gcs_client: storage.Client, module_bucket: storage.Bucket) -> Generator[storage.Bucket, None, None]:
+    """Provide the test bucket, emptied after each test."""
+    yield module_bucket
+
+    # Cleanup: delete all blobs in bucket in one batch request
+    blobs = list(module_bucket.list_blobs())
+    if blobs:  # An empty batch raises on exit
+        with gcs_client.batch():
+            for blob in blobs:
+                blob.delete()
+
+
+@pytest.fixture(scope="module")
 def gcs_file_io() -> GCSFileIO:
     """Create a GCSFileIO instance with Polars engine."""
     return GCSFileIO(local=True, engine="polars")
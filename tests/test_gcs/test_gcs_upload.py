@@ -21,15 +21,15 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gcs_client() -> storage.Client:
     """Create a GCS client for the emulator."""
     return storage.Client()
 
 
-@pytest.fixture
-def test_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, None]:
-    """Create a test bucket."""
+@pytest.fixture(scope="module")
+def module_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, None]:
+    """Create the test bucket once for every test in this module."""
     bucket_name = "test-bucket-upload"
     bucket = gcs_client.bucket(bucket_name)
 
@@ -39,15 +39,24 @@ def test_bucket(gcs_client: storage.Client) -> Generator[storage.Bucket, None, N
 
     yield bucket
 
-    # Cleanup: delete all blobs in bucket
     with contextlib.suppress(Exception):
-        blobs = list(bucket.list_blobs())
-        for blob in blobs:
-            blob.delete()
         bucket.delete()
 
 
 @pytest.fixture
+def test_bucket(gcs_client: storage.Client, module_bucket: storage.Bucket) -> Generator[storage.Bucket, None, None]:
+    """Provide the test bucket, emptied after each test."""
+    yield module_bucket
+
+    # Cleanup: delete all blobs in bucket in one batch request
+    blobs = list(module_bucket.list_blobs())
+    if blobs:  # An empty batch raises on exit
+        with gcs_client.batch():
+            for blob in blobs:
+                blob.delete()
+
+
+@pytest.fixture(scope="module")
 def gcs_file_io() -> GCSFileIO:
     """Create a GCSFileIO instance."""
     return GCSFileIO(local=True)
@@ -60,6 +69,12 @@ def test_gcs_file_io_init_local() -> None:
     assert gcs_io.client is not None
 
 
+def test_gcs_file_io_local_client_shared() -> None:
+    """Test that local instances share one emulator client per pool size."""
+    assert GCSFileIO(local=True).client is GCSFileIO(local=True).client
+    assert GCSFileIO(local=True, max_workers=2).client is not GCSFileIO(local=True).client
+
+
 def test_upload_file_single(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
@@ -159,6 +174,23 @@ def test_upload_object_dataframe_csv(
     pd.testing.assert_frame_equal(downloaded_data, test_data)
 
 
+def test_upload_object_dataframe_csv_use_arrow(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test uploading DataFrame object as CSV file with the pyarrow writer."""
+    # Setup: Create test DataFrame
+    test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+    # Test: Upload the DataFrame using the Arrow CSV writer
+    blob_name = "test_arrow.csv"
+    gcs_file_io.upload((test_data, f"gs://{test_bucket.name}/{blob_name}"), use_arrow=True)
+
+    # Verify: The CSV parses back to the same frame without an index column
+    csv_content = test_bucket.blob(blob_name).download_as_text()
+    pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(csv_content)), test_data)
+
+
 def test_upload_object_dataframe_xlsx(
     gcs_file_io: GCSFileIO,
     test_bucket: storage.Bucket,
@@ -196,14 +228,35 @@ def test_upload_object_string_json(
 
     gcs_file_io._upload_object([(test_data, test_uri)])
 
-    # Verify: Check the uploaded content
-    blob = test_bucket.blob(blob_name)
-    assert blob.exists()
+    # Verify: Check the uploaded content is stored as-is
+    blob = test_bucket.get_blob(blob_name)
+    assert blob is not None
 
     json_content = blob.download_as_text()
 
-    uploaded_as_json = json.loads(json_content)
-    assert uploaded_as_json == test_data
+    assert json_content == test_data
+    assert blob.content_type == "application/json"
+
+
+def test_upload_object_dict_json(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+) -> None:
+    """Test uploading dict and list objects as JSON files."""
+    # Setup: Create test objects
+    test_objects = {
+        "dict.json": {"key": "value", "nested": {"number": 42}},
+        "list.json": [1, "two", {"three": 3}],
+    }
+
+    # Test: Upload the objects as JSON
+    gcs_file_io._upload_object([(obj, f"gs://{test_bucket.name}/{name}") for name, obj in test_objects.items()])
+
+    # Verify: Check the uploaded content round-trips
+    for name, obj in test_objects.items():
+        blob = test_bucket.get_blob(name)
+        assert json.loads(blob.download_as_text()) == obj
+        assert blob.content_type == "application/json"
 
 
 def test_upload_object_unsupported_type(
@@ -213,7 +266,7 @@ def test_upload_object_unsupported_type(
     """Test uploading unsupported object types fails."""
     # Test: Try to upload unsupported objects
     unsupported_objects = [
-        ({"key": "value"}, f"gs://{test_bucket.name}/dict.json"),  # Dict without .json processing
+        ({"key": "value"}, f"gs://{test_bucket.name}/dict.csv"),  # Dict
         ([1, 2, 3], f"gs://{test_bucket.name}/list.csv"),  # List
         ("string", f"gs://{test_bucket.name}/string.txt"),  # String
         (123, f"gs://{test_bucket.name}/number.csv"),  # Number
@@ -338,3 +391,27 @@ def test_upload_with_metadata(
     assert blob.metadata is not None
     assert blob.metadata["custom-field"] == "test-value"
     assert blob.metadata["author"] == "pytest"
+
+
+def test_upload_env_metadata_set_at_runtime(
+    gcs_file_io: GCSFileIO,
+    test_bucket: storage.Bucket,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that environment metadata set after an earlier upload (e.g. by the CLA) is still attached."""
+    monkeypatch.delenv("DAG_ID", raising=False)
+
+    # Test: Upload before and after the variable is set
+    first_uri = f"gs://{test_bucket.name}/before_env.json"
+    gcs_file_io.upload((["before"], first_uri))
+
+    monkeypatch.setenv("DAG_ID", "runtime-dag")
+    second_uri = f"gs://{test_bucket.name}/after_env.json"
+    gcs_file_io.upload((["after"], second_uri))
+
+    # Verify: Only the second upload carries the variable
+    first_blob = test_bucket.get_blob("before_env.json")
+    second_blob = test_bucket.get_blob("after_env.json")
+    assert "DAG_ID" not in (first_blob.metadata or {})
+    assert second_blob.metadata is not None
+    assert second_blob.metadata["DAG_ID"] == "runtime-dag"
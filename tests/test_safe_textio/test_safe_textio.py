@@ -232,6 +232,35 @@ def test_parse_secret(setup_test_environment: dict[str, Any]) -> None:
     )
 
 
+def test_parse_secret_json_array(tmp_path: Path) -> None:
+    """Test that JSON array secrets are parsed and every item is censored."""
+    test_path = tmp_path / "tokens.json"
+    test_path.write_text('["token_one", "token_two"]')
+
+    content = SecretManager.parse_secret(test_path)
+
+    assert content == ["token_one", "token_two"]
+    assert "token_one" in SafeTextIO._bad_words
+    assert "token_two" in SafeTextIO._bad_words
+
+
+def test_parse_secret_nested_json(tmp_path: Path) -> None:
+    """Test that nested JSON string values are censored while empty and non-string values are skipped."""
+    test_path = tmp_path / "nested.json"
+    test_path.write_text(
+        '{"credentials": {"password": "nested_password"}, "tokens": ["nested_token"], "empty": "", "flag": true, '
+        '"port": 4431}',
+    )
+
+    SecretManager.parse_secret(test_path)
+
+    assert "nested_password" in SafeTextIO._bad_words
+    assert "nested_token" in SafeTextIO._bad_words
+    assert "" not in SafeTextIO._bad_words
+    assert "True" not in SafeTextIO._bad_words
+    assert "4431" not in SafeTextIO._bad_words
+
+
 def test_process_secret_folder(setup_test_environment: dict[str, Any]) -> None:
     """Test adding secrets from actual files in the vault/secrets directory."""
     test_secrets_folder = setup_test_environment["test_secrets_folder"]
@@ -5,8 +5,13 @@ import tempfile
 from collections.abc import Generator
 from pathlib import Path
 
+import fakesnow.fixtures
 import pytest
 
+# Re-exported here instead of registering the whole plugin in tests/conftest.py (pytest only allows
+# pytest_plugins at the root), so fakesnow and its dependencies load only for the Snowflake tests
+fakesnow_server = fakesnow.fixtures.fakesnow_server
+
 
 @pytest.fixture
 def temp_credentials(fakesnow_server: dict) -> Generator[str, None, None]:
@@ -1,8 +1,34 @@
 """Tests for Snowflake execute functionality."""
 
+import asyncio
+from collections import Counter
+from unittest import mock
+
+import pyarrow as pa
+import pytest
+from snowflake.connector.constants import QueryStatus
+from snowflake.connector.cursor import SnowflakeCursor
+
 from dataeng_container_tools import Snowflake
 
 
+def _mock_query_status(sf: Snowflake, monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Report each query as running on its first status check and finished afterwards.
+
+    fakesnow runs submitted queries to completion straight away and has no query monitoring
+    endpoint to poll, so the status lookups are mocked while results still come from the server.
+    """
+    status_checks: Counter[str] = Counter()
+
+    def get_query_status(query_id: str) -> QueryStatus:
+        status_checks[query_id] += 1
+        return QueryStatus.RUNNING if status_checks[query_id] == 1 else QueryStatus.SUCCESS
+
+    monkeypatch.setattr(sf.ctx, "get_query_status", get_query_status)
+    monkeypatch.setattr(sf.ctx, "get_query_status_throw_if_error", lambda _query_id: QueryStatus.SUCCESS)
+    return status_checks
+
+
 def test_execute_simple_query(fakesnow_server: dict, temp_credentials: str) -> None:
     """Test executing a simple SELECT query."""
     sf = Snowflake(
@@ -124,3 +150,306 @@ def test_execute_empty_result(fakesnow_server: dict, temp_credentials: str) -> N
 
     # Verify: Result should be empty
     assert result == []
+
+
+def test_execute_fetch_pandas(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test fetching query results as a pandas DataFrame."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Setup data and fetch it as a DataFrame
+    sf.execute("CREATE TABLE fetch_table (id INT, name STRING)")
+    sf.execute("INSERT INTO fetch_table VALUES (1, 'Alice'), (2, 'Bob')")
+    result = sf.execute("SELECT id, name FROM fetch_table ORDER BY id", fetch="pandas")
+
+    # Verify: Columns and values match
+    assert list(result.columns) == ["ID", "NAME"]
+    assert result["ID"].tolist() == [1, 2]
+    assert result["NAME"].tolist() == ["Alice", "Bob"]
+
+
+def test_execute_fetch_columns(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test fetching query results as a dict of columns."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Setup data and fetch it column-wise
+    sf.execute("CREATE TABLE columns_table (id INT, name STRING)")
+    sf.execute("INSERT INTO columns_table VALUES (1, 'Alice'), (2, 'Bob')")
+    result = sf.execute("SELECT id, name FROM columns_table ORDER BY id", fetch="columns")
+
+    # Verify: One list per column
+    assert result == {"ID": [1, 2], "NAME": ["Alice", "Bob"]}
+
+
+def test_execute_with_params_and_execute_many(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test binding parameters and executing a statement for many parameter sets."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Insert rows in a batch, then select with a bound parameter
+    sf.execute("CREATE TABLE params_table (id INT, name STRING)")
+    inserted = sf.execute_many("INSERT INTO params_table VALUES (%s, %s)", [(1, "Alice"), (2, "Bob"), (3, "Carol")])
+    result = sf.execute("SELECT name FROM params_table WHERE id > %s ORDER BY id", (1,))
+
+    # Verify: All rows were inserted and the filter was applied
+    assert inserted == 3
+    assert result == [("Bob",), ("Carol",)]
+
+
+def test_execute_iter(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test iterating query results batch by batch."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Setup data and iterate over it
+    sf.execute("CREATE TABLE iter_table (id INT)")
+    sf.execute("INSERT INTO iter_table VALUES (1), (2), (3)")
+    result = list(sf.execute_iter("SELECT id FROM iter_table ORDER BY id"))
+
+    # Verify: Rows match a regular execute
+    assert result == [(1,), (2,), (3,)]
+
+
+def test_execute_stream(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test that streamed Arrow record batches rebuild the full result."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Setup data and stream it
+    sf.execute("CREATE TABLE stream_table (id INT, name STRING)")
+    sf.execute("INSERT INTO stream_table VALUES (1, 'Alice'), (2, 'Bob'), (3, 'Carol')")
+    query = "SELECT id, name FROM stream_table ORDER BY id"
+    batches = list(sf.execute_stream(query))
+
+    # Verify: The batches form the same table as a regular Arrow fetch
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert pa.Table.from_batches(batches).equals(sf.execute(query, fetch="arrow"))
+
+
+def test_execute_stream_early_exit(
+    fakesnow_server: dict,
+    temp_credentials: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the stream's cursor is closed when the caller stops after the first batch."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Setup: Record the cursors the stream opens and whether they are closed
+    cursor_closes: list[mock.Mock] = []
+    open_cursor = sf.ctx.cursor
+
+    def recording_cursor() -> SnowflakeCursor:
+        cursor = open_cursor()
+        cursor_close = mock.Mock(wraps=cursor.close)
+        monkeypatch.setattr(cursor, "close", cursor_close)
+        cursor_closes.append(cursor_close)
+        return cursor
+
+    monkeypatch.setattr(sf.ctx, "cursor", recording_cursor)
+
+    # Test: Take the first batch, then stop
+    stream = sf.execute_stream("SELECT 1 AS id")
+    first_batch = next(stream)
+    assert len(cursor_closes) == 1
+    cursor_closes[0].assert_not_called()
+    stream.close()
+
+    # Verify: The batch was read and the cursor is closed
+    assert first_batch.num_rows == 1
+    cursor_closes[0].assert_called_once()
+
+
+def test_execute_batches_parallel(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test downloading result batches concurrently into one Arrow table."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Setup data and download its batches in parallel
+    sf.execute("CREATE TABLE parallel_table (id INT, name STRING)")
+    sf.execute("INSERT INTO parallel_table VALUES (1, 'Alice'), (2, 'Bob'), (3, 'Carol')")
+    query = "SELECT id, name FROM parallel_table ORDER BY id"
+    result = sf.execute_batches_parallel(query, max_workers=2)
+
+    # Verify: The table matches a regular Arrow fetch
+    assert result.to_pydict() == {"ID": [1, 2, 3], "NAME": ["Alice", "Bob", "Carol"]}
+    assert result.equals(sf.execute(query, fetch="arrow"))
+
+
+def test_execute_all(fakesnow_server: dict, temp_credentials: str) -> None:
+    """Test executing several queries concurrently."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+
+    # Test: Execute independent queries together
+    result = sf.execute_all(["SELECT 1", "SELECT 2", "SELECT 3"])
+
+    # Verify: Results are returned in query order
+    assert result == [[(1,)], [(2,)], [(3,)]]
+
+
+def test_execute_async_fetch_result(
+    fakesnow_server: dict,
+    temp_credentials: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test submitting a query and collecting its results by query ID."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+    _mock_query_status(sf, monkeypatch)
+
+    # Test: Submit a query, then fetch its results
+    query_id = sf.execute_async("SELECT 1 AS id")
+    result = sf.fetch_result(query_id)
+
+    # Verify: The query ID is returned and the results match a regular execute
+    assert isinstance(query_id, str)
+    assert query_id
+    assert result == [(1,)]
+
+
+def test_execute_awaitable_gather(
+    fakesnow_server: dict,
+    temp_credentials: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test awaiting several queries together while their status is polled."""
+    sf = Snowflake(
+        role="test_role",
+        database="test_db",
+        schema="test_schema",
+        warehouse="test_warehouse",
+        account=fakesnow_server["account"],
+        query_tag="test_query",
+        sf_secret_location=temp_credentials,
+        host=fakesnow_server["host"],
+        port=fakesnow_server["port"],
+        protocol=fakesnow_server["protocol"],
+        session_parameters=fakesnow_server["session_parameters"],
+        network_timeout=fakesnow_server["network_timeout"],
+    )
+    status_checks = _mock_query_status(sf, monkeypatch)
+    monkeypatch.setattr(Snowflake, "ASYNC_POLL_INTERVAL", 0)
+
+    async def run_queries() -> list:
+        return await asyncio.gather(
+            sf.execute_awaitable("SELECT 1 AS id"),
+            sf.execute_awaitable("SELECT 2 AS id", fetch="columns"),
+        )
+
+    # Test: Await two queries at once
+    result = asyncio.run(run_queries())
+
+    # Verify: Results are returned in call order, each query was polled until it finished
+    assert result == [[(1,)], {"ID": [2]}]
+    assert len(status_checks) == 2
+    assert all(checks >= 2 for checks in status_checks.values())